@@ -16,6 +16,9 @@ class DataManager:
         self.mixed_list = self.get_preprocessed_files("spectral/mixed_pre_processed")
         self.mixed_pre_processed_folder = "spectral/mixed_pre_processed"
         
+        # Parsed spectra by absolute path, as (modification time, DataFrame)
+        self._spectrum_cache = {}
+        
     
     def get_preprocessed_files(self, folder):
         """Get list of preprocessed files without extension"""
@@ -280,7 +283,28 @@ class DataManager:
                 raise ValueError(f"Spectra preprocessing failed: {error_str}")
     
     def load_spectrum(self, file_path):
-        """Load a pre-processed spectrum file and return as DataFrame"""
+        """
+        Load a pre-processed spectrum file and return as DataFrame.
+        Parsed files are cached until their modification time changes; each
+        call returns a copy, so callers may modify it freely.
+        """
+        try:
+            cache_key = os.path.abspath(file_path)
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            # Let the reader report the missing or unreadable file
+            return self._read_spectrum(file_path)
+        
+        cached = self._spectrum_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1].copy()
+        
+        data_df = self._read_spectrum(file_path)
+        self._spectrum_cache[cache_key] = (mtime, data_df)
+        return data_df.copy()
+    
+    def _read_spectrum(self, file_path):
+        """Parse and validate a pre-processed spectrum file"""
         try:
             # Pre-processed files are always tab-separated with a header
             data_df = pd.read_csv(file_path, sep='\t')
@@ -0,0 +1,172 @@
+"""
+Streaming Excel writer for exporting spectral tables
+"""
+
+from datetime import datetime, timezone
+from importlib.metadata import version, PackageNotFoundError
+from zipfile import ZipFile, ZIP_DEFLATED
+
+# Deflate level for the openpyxl archive: the sheets are numeric XML that
+# compresses well even at the fastest level (zlib's default is 6)
+ZIP_COMPRESSLEVEL = 1
+
+# Oldest rustpy-xlsxwriter whose FastExcel(path).sheet(name, df).save() API
+# has been checked by reading its workbooks back; older releases are not used
+FASTEXCEL_MIN_VERSION = (0, 7, 1)
+
+# Excel backends, imported on the first export rather than at startup
+_backends = None
+
+
+def _load_backends():
+    """Import the optional Excel writers once, returning (FastExcel, xlsxwriter)"""
+    global _backends
+    if _backends is None:
+        try:
+            import xlsxwriter
+        except ImportError:
+            xlsxwriter = None
+
+        # Optional Rust-backed writer that takes whole DataFrames
+        try:
+            from rustpy_xlsxwriter import FastExcel
+            if _version_tuple(version("rustpy-xlsxwriter")) < FASTEXCEL_MIN_VERSION:
+                FastExcel = None
+        except (ImportError, PackageNotFoundError, ValueError):
+            FastExcel = None
+
+        _backends = (FastExcel, xlsxwriter)
+    return _backends
+
+
+def _version_tuple(text):
+    """Numeric (major, minor, patch) of a version string such as '0.7.1'"""
+    return tuple(int(part) for part in text.split(".")[:3])
+
+
+class ExcelExporter:
+    """Writes DataFrames to .xlsx workbooks without holding the sheets in memory"""
+
+    @staticmethod
+    def write_sheets(file_path, sheets):
+        """
+        Write DataFrames to an Excel workbook, streaming rows to disk
+
+        Parameters:
+        -----------
+        file_path : str
+            Output .xlsx path
+        sheets : list of (str, pd.DataFrame)
+            Sheet names (max 31 characters) and frames, in workbook order
+
+        Notes:
+        ------
+        rustpy_xlsxwriter's FastExcel is used when a release at or above
+        FASTEXCEL_MIN_VERSION is installed. Otherwise,
+        or if it fails, xlsxwriter's constant_memory mode is used, and
+        openpyxl's write-only mode when xlsxwriter is missing too.
+        """
+        FastExcel, xlsxwriter = _load_backends()
+
+        if FastExcel is not None:
+            try:
+                ExcelExporter._write_fastexcel(FastExcel, file_path, sheets)
+                return
+            except Exception as e:
+                print(f"Warning: FastExcel export failed, using the streaming writer: {e}")
+
+        if xlsxwriter is not None:
+            ExcelExporter._write_xlsxwriter(xlsxwriter, file_path, sheets)
+        else:
+            ExcelExporter._write_openpyxl(file_path, sheets)
+
+    @staticmethod
+    def _write_fastexcel(FastExcel, file_path, sheets):
+        """Write sheets with FastExcel, one call per whole DataFrame"""
+        writer = FastExcel(file_path)
+        for sheet_name, df in sheets:
+            writer = writer.sheet(sheet_name, df)
+        writer.save()
+
+    @staticmethod
+    def _write_xlsxwriter(xlsxwriter, file_path, sheets):
+        """
+        Write sheets with xlsxwriter in constant_memory mode
+
+        In constant_memory mode each row is flushed to disk as soon as the next
+        row is started, so cells must be written strictly row by row. pandas'
+        to_excel writes column by column and would silently lose data here,
+        which is why rows are streamed directly. Missing values are skipped,
+        leaving blank cells as the openpyxl writer does, rather than the #NUM!
+        errors nan_inf_to_errors would write for NaN.
+        """
+        workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True,
+                                                   'nan_inf_to_errors': True})
+        try:
+            header_format = workbook.add_format({'bold': True})
+
+            for sheet_name, df in sheets:
+                worksheet = workbook.add_worksheet(sheet_name)
+                worksheet.write_row(0, 0, [str(col) for col in df.columns], header_format)
+
+                # Pick the cell writer once per column; write() would sniff the
+                # type of every cell again
+                writers = [worksheet.write_number if is_numeric else worksheet.write
+                           for is_numeric in ExcelExporter._numeric_columns(df)]
+
+                for row_idx, row in enumerate(zip(*ExcelExporter._column_values(df)), start=1):
+                    for col_idx, (write, value) in enumerate(zip(writers, row)):
+                        if value is not None:
+                            write(row_idx, col_idx, value)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _write_openpyxl(file_path, sheets):
+        """
+        Write sheets with an openpyxl write-only workbook
+
+        Write-only worksheets only support append(), and each row is serialized
+        as it is added. Missing cells are left empty, as pandas' to_excel does;
+        they are found once per column rather than per cell. The
+        archive is deflated at ZIP_COMPRESSLEVEL instead of zlib's default.
+        """
+        from openpyxl import Workbook
+        from openpyxl.writer.excel import ExcelWriter
+
+        workbook = Workbook(write_only=True)
+
+        for sheet_name, df in sheets:
+            worksheet = workbook.create_sheet(sheet_name)
+            worksheet.append([str(col) for col in df.columns])
+
+            for row in zip(*ExcelExporter._column_values(df)):
+                worksheet.append(row)
+
+        # Mirrors Workbook.save() and openpyxl's save_workbook(), except for the
+        # compression level of the zip archive
+        if not workbook.worksheets:
+            workbook.create_sheet()
+        workbook.properties.modified = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+        with ZipFile(file_path, 'w', ZIP_DEFLATED, allowZip64=True,
+                     compresslevel=ZIP_COMPRESSLEVEL) as archive:
+            ExcelWriter(workbook, archive).save()
+
+    @staticmethod
+    def _column_values(df):
+        """Columns of df as object arrays, with missing values (NaN, None) as None"""
+        columns = []
+        for col_idx in range(df.shape[1]):
+            column = df.iloc[:, col_idx]
+            values = column.to_numpy(dtype=object)
+            missing = column.isna().to_numpy()
+            if missing.any():
+                values[missing] = None
+            columns.append(values)
+        return columns
+
+    @staticmethod
+    def _numeric_columns(df):
+        """Flag the integer and float columns of df, whose cells need no type detection"""
+        return [dtype.kind in 'iuf' for dtype in df.dtypes]
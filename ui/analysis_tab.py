@@ -118,6 +118,11 @@ class AnalysisTab:
                                   command=self.run_analysis_from_ui, state="disabled")
         self.run_button.pack(fill="x", ipady=10)
         
+        # Re-runs open a new result tab unless the user asks to replace the last one
+        self.replace_result_var = tk.BooleanVar(value=False)
+        tb.Checkbutton(run_frame, text="Replace previous result for this sample and algorithm", 
+                      variable=self.replace_result_var).pack(anchor="w", pady=5)
+        
         # Add tooltip for disabled button
         self.run_tooltip = tb.Label(run_frame, text="Select spectra to enable analysis", 
                                   bootstyle="secondary", font=("TkDefaultFont", 8))
@@ -476,7 +481,7 @@ Key features:
                         algorithm, mixed_item, WLSendmembers, WLSA, WLSaberror, 
                         WLSfit, WLSresidual, M, measurerr, wavenumber, WLSrms, maxwl,
                         all_selected_endmembers=endmembers, mixed_spectrum_data=mixed_df, 
-                        endmember_spectral_data=EMdat)
+                        endmember_spectral_data=EMdat, replace=self.replace_result_var.get())
                 
             else:  # STO
                 STOfit, STOresidual, STOendmembers, STOA, STOaberror, STOnorm, STOrms = \
@@ -488,7 +493,8 @@ Key features:
                         algorithm, mixed_item, STOendmembers, STOA, STOaberror, 
                         STOfit, STOresidual, M, measurerr, wavenumber, STOrms, maxwl, 
                         normalized_abundances=STOnorm, all_selected_endmembers=endmembers,
-                        mixed_spectrum_data=mixed_df, endmember_spectral_data=EMdat)
+                        mixed_spectrum_data=mixed_df, endmember_spectral_data=EMdat,
+                        replace=self.replace_result_var.get())
             
             # Switch to results tab
             notebook = self.frame.master
@@ -10,7 +10,9 @@ import pandas as pd
 import ttkbootstrap as tb
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.collections import PolyCollection
 import matplotlib.colors as mcolors
+from core.excel_writer import ExcelExporter
 
 
 class MultiSpectrumViewer:
@@ -21,7 +23,13 @@ class MultiSpectrumViewer:
         self.data_manager = data_manager
         self.loaded_spectra = {}  # Dictionary to store loaded spectra data
         self.color_cycle = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
+        # Resolve colors to RGBA once so artists never re-parse the color names
+        self.color_cycle_rgba = [mcolors.to_rgba(c) for c in self.color_cycle]
         self.color_index = 0
+        self._plot_ready = False  # True while the axes hold the cached spectrum artists
+        self._legend = None  # Rebuilt only when the set of loaded spectra changes
+        self._pending_update = None  # Tk after() id of the scheduled redraw
+        self._tv_ids = {}  # Spectrum name -> loaded_tv item id
         
         # Create window
         self.window = tb.Toplevel(parent)
@@ -29,6 +37,16 @@ class MultiSpectrumViewer:
         self.window.geometry("1200x800")
         
         self.setup_ui()
+        self.window.bind("<Destroy>", self._on_destroy, add="+")
+    
+    def _on_destroy(self, event):
+        """Cancel a scheduled redraw when the window closes"""
+        # Children's <Destroy> events also reach the toplevel binding
+        if event.widget is not self.window:
+            return
+        if self._pending_update:
+            self.window.after_cancel(self._pending_update)
+            self._pending_update = None
     
     def get_theme_colors(self):
         """Get appropriate colors based on current theme"""
@@ -206,6 +224,7 @@ class MultiSpectrumViewer:
     def show_empty_plot(self):
         """Show empty plot with instructions"""
         self.ax.clear()
+        self._plot_ready = False
         
         # Get theme colors
         theme_colors = self.get_theme_colors()
@@ -247,10 +266,13 @@ class MultiSpectrumViewer:
         
         for index in selection:
             spectrum_name = listbox.get(index)
-            self.add_spectrum(spectrum_name, spectra_type)
+            self.add_spectrum(spectrum_name, spectra_type, _bulk=True)
+        
+        # Redraw once for the whole selection
+        self.update_plot()
     
-    def add_spectrum(self, name, spectra_type):
-        """Add a spectrum to the comparison"""
+    def add_spectrum(self, name, spectra_type, _bulk=False):
+        """Add a spectrum to the comparison; with _bulk the caller updates the plot"""
         if name in self.loaded_spectra:
             messagebox.showinfo("Info", f"Spectrum '{name}' is already loaded")
             return
@@ -262,38 +284,60 @@ class MultiSpectrumViewer:
             spectrum_df = self.data_manager.load_spectrum(file_path)
             
             # Assign color
-            color = self.color_cycle[self.color_index % len(self.color_cycle)]
+            color_slot = self.color_index % len(self.color_cycle)
             self.color_index += 1
             
+            # Plot arrays are extracted once at load; float32 is ample for
+            # display and halves the bytes copied into the Agg path buffers
+            wavelength = np.ascontiguousarray(10000 / spectrum_df['Wavenumber'].to_numpy(), dtype=np.float32)
+            emissivity = np.ascontiguousarray(spectrum_df['Emissivity'].to_numpy(), dtype=np.float32)
+            uncertainty = np.ascontiguousarray(spectrum_df['Uncertainty'].to_numpy(), dtype=np.float32)
+            
             # Store spectrum data
             self.loaded_spectra[name] = {
                 'data': spectrum_df,
+                'wavelength': wavelength,
+                'emissivity': emissivity,
+                'uncertainty': uncertainty,
                 'type': spectra_type,
-                'color': color,
+                'color': self.color_cycle_rgba[color_slot],
+                'color_name': self.color_cycle[color_slot],
                 'visible': True
             }
             
-            # Update loaded spectra tree
-            self.update_loaded_tree()
+            # Create the cached artists now if the axes are already populated,
+            # otherwise the next update_plot rebuilds them all
+            if self._plot_ready:
+                self._add_artists(name, self.loaded_spectra[name])
+                self._legend = None
             
-            # Update plot
-            self.update_plot()
+            # Add a row to the loaded spectra tree
+            self._insert_tree_row(name, self.loaded_spectra[name])
+            
+            if not _bulk:
+                # Update plot
+                self.update_plot()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load spectrum '{name}': {str(e)}")
     
     def update_loaded_tree(self):
-        """Update the loaded spectra treeview"""
+        """Rebuild the loaded spectra treeview from scratch"""
         # Clear existing items
         for item in self.loaded_tv.get_children():
             self.loaded_tv.delete(item)
+        self._tv_ids.clear()
         
         # Add loaded spectra
         for name, info in self.loaded_spectra.items():
-            visibility = "✓" if info['visible'] else "✗"
-            type_label = "End-Member" if info['type'] == "end_member" else "Mixed"
-            
-            self.loaded_tv.insert("", "end", values=(name, type_label, info['color'], visibility))
+            self._insert_tree_row(name, info)
+    
+    def _insert_tree_row(self, name, info):
+        """Append a spectrum to the loaded spectra treeview and remember its item id"""
+        visibility = "✓" if info['visible'] else "✗"
+        type_label = "End-Member" if info['type'] == "end_member" else "Mixed"
+        
+        self._tv_ids[name] = self.loaded_tv.insert("", "end", values=(name, type_label, info['color_name'], visibility))
     
     def toggle_spectrum_visibility(self, event):
         """Toggle visibility of selected spectrum"""
@@ -305,8 +349,9 @@ class MultiSpectrumViewer:
         spectrum_name = self.loaded_tv.item(item, "values")[0]
         
         if spectrum_name in self.loaded_spectra:
-            self.loaded_spectra[spectrum_name]['visible'] = not self.loaded_spectra[spectrum_name]['visible']
-            self.update_loaded_tree()
+            visible = not self.loaded_spectra[spectrum_name]['visible']
+            self.loaded_spectra[spectrum_name]['visible'] = visible
+            self.loaded_tv.set(self._tv_ids[spectrum_name], "visible", "✓" if visible else "✗")
             self.update_plot()
     
     def remove_selected_spectra(self):
@@ -319,102 +364,183 @@ class MultiSpectrumViewer:
         for item in selection:
             spectrum_name = self.loaded_tv.item(item, "values")[0]
             if spectrum_name in self.loaded_spectra:
-                del self.loaded_spectra[spectrum_name]
+                info = self.loaded_spectra.pop(spectrum_name)
+                self.loaded_tv.delete(self._tv_ids.pop(spectrum_name))
+                if self._plot_ready:
+                    info['line'].remove()
+                    info['band'].remove()
+                    self._legend = None
         
-        self.update_loaded_tree()
         self.update_plot()
     
     def clear_all_spectra(self):
         """Clear all loaded spectra"""
         if self.loaded_spectra and messagebox.askyesno("Confirm", "Remove all loaded spectra?"):
+            if self._pending_update:
+                self.window.after_cancel(self._pending_update)
+                self._pending_update = None
             self.loaded_spectra.clear()
             self.color_index = 0
             self.update_loaded_tree()
             self.show_empty_plot()
     
     def update_plot(self):
+        """Schedule a plot update, coalescing rapid requests into one redraw"""
+        if self._pending_update:
+            self.window.after_cancel(self._pending_update)
+        # ~16 ms caps redraws at roughly 60 per second
+        self._pending_update = self.window.after(16, self._do_update_plot)
+    
+    def _do_update_plot(self):
         """Update the comparison plot"""
-        self.ax.clear()
+        self._pending_update = None
         
         if not self.loaded_spectra:
             self.show_empty_plot()
             return
         
-        # Get visible spectra
-        visible_spectra = {name: info for name, info in self.loaded_spectra.items() if info['visible']}
+        if not self._plot_ready:
+            self._rebuild_artists()
         
-        if not visible_spectra:
-            # Get theme colors
-            theme_colors = self.get_theme_colors()
-            
-            self.ax.text(0.5, 0.5, 'No visible spectra\nDouble-click items in the list to show/hide', 
-                        horizontalalignment='center', verticalalignment='center',
-                        transform=self.ax.transAxes, fontsize=12, 
-                        color='gray', style='italic')
-            self.ax.set_xlabel('Wavelength (μm)', fontsize=12, color=theme_colors['text'])
-            self.ax.set_ylabel('Emissivity', fontsize=12, color=theme_colors['text'])
-            self.ax.set_title('Multi-Spectrum Comparison', fontsize=14, color=theme_colors['text'])
-            self.ax.grid(True, alpha=0.3, color=theme_colors['grid'])
-            self.ax.tick_params(colors=theme_colors['text'])
-            self.canvas.draw()
-            return
+        self._refresh_artists()
+        self.canvas.draw()
+    
+    def _rebuild_artists(self):
+        """Clear the axes and create the cached artists for every loaded spectrum"""
+        self.ax.clear()
+        
+        # Hidden until every spectrum has been toggled off
+        self._no_visible_text = self.ax.text(0.5, 0.5, 'No visible spectra\nDouble-click items in the list to show/hide', 
+                                             horizontalalignment='center', verticalalignment='center',
+                                             transform=self.ax.transAxes, fontsize=12, 
+                                             color='gray', style='italic', visible=False)
+        
+        # Text is set here; its theme colors are applied on every refresh
+        self.ax.set_xlabel('Wavelength (μm)', fontsize=12)
+        self.ax.set_title('Multi-Spectrum Comparison', fontsize=14)
+        
+        for name, info in self.loaded_spectra.items():
+            self._add_artists(name, info)
+        
+        self._legend = None
+        self._plot_ready = True
+    
+    def _add_artists(self, name, info):
+        """Create the line and uncertainty band for a spectrum; data is filled in by _refresh_artists"""
+        line_style = '-' if info['type'] == 'end_member' else '--'
+        label = f"{name} ({'EM' if info['type'] == 'end_member' else 'Mixed'})"
+        
+        info['line'], = self.ax.plot([], [], color=info['color'], linewidth=2, 
+                                     linestyle=line_style, label=label)
+        
+        # One PolyCollection per spectrum, updated in place with set_verts
+        info['band'] = PolyCollection([], facecolors=[info['color']], alpha=0.2)
+        self.ax.add_collection(info['band'], autolim=False)
+        info['band_key'] = None
+    
+    def _build_legend(self):
+        """Create the legend for all loaded spectra and remember each spectrum's handle"""
+        lines = [info['line'] for info in self.loaded_spectra.values()]
+        self._legend = self.ax.legend(handles=lines, bbox_to_anchor=(1.05, 1), loc='upper left')
+        
+        # legendHandles was renamed to legend_handles in matplotlib 3.7
+        handles = getattr(self._legend, 'legend_handles', None) or self._legend.legendHandles
+        for info, handle in zip(self.loaded_spectra.values(), handles):
+            # Handles copy the line's visibility; hidden spectra are only dimmed
+            handle.set_visible(True)
+            info['legend_handle'] = handle
+    
+    def _refresh_artists(self):
+        """Update data, visibility and styling of the cached artists"""
+        normalize = self.normalize_var.get()
+        show_uncertainty = self.uncertainty_var.get()
         
-        # Plot each visible spectrum
         offset_value = 0
         offset_increment = 0.1 if self.offset_var.get() else 0
         
-        for i, (name, info) in enumerate(visible_spectra.items()):
-            spectrum_df = info['data']
-            color = info['color']
+        visible_lines = []
+        visible_bands = []
+        
+        for name, info in self.loaded_spectra.items():
+            line = info['line']
+            band = info['band']
             
-            # Extract data
-            wavenumber = spectrum_df['Wavenumber'].values
-            wavelength = 10000 / wavenumber
-            emissivity = spectrum_df['Emissivity'].values
-            uncertainty = spectrum_df['Uncertainty'].values
+            if not info['visible']:
+                line.set_visible(False)
+                band.set_visible(False)
+                continue
             
-            # Apply normalization if requested
-            if self.normalize_var.get():
-                emissivity = (emissivity - emissivity.min()) / (emissivity.max() - emissivity.min())
-                uncertainty = uncertainty / (spectrum_df['Emissivity'].max() - spectrum_df['Emissivity'].min())
+            wavelength = info['wavelength']
+            emissivity = info['emissivity']
+            uncertainty = info['uncertainty']
             
-            # Apply offset
-            plot_emissivity = emissivity + offset_value
-            plot_uncertainty = uncertainty
+            # Apply normalization if requested
+            if normalize:
+                em_min = emissivity.min()
+                em_range = emissivity.max() - em_min
+                emissivity = (emissivity - em_min) / em_range
+                uncertainty = uncertainty / em_range
             
-            # Plot spectrum
-            line_style = '-' if info['type'] == 'end_member' else '--'
-            label = f"{name} ({'EM' if info['type'] == 'end_member' else 'Mixed'})"
+            # Apply offset (kept in float32)
+            plot_emissivity = emissivity + np.float32(offset_value)
             
-            self.ax.plot(wavelength, plot_emissivity, color=color, linewidth=2, 
-                        linestyle=line_style, label=label)
+            line.set_data(wavelength, plot_emissivity)
+            line.set_visible(True)
+            visible_lines.append(line)
             
-            # Add uncertainties if requested
-            if self.uncertainty_var.get():
-                self.ax.fill_between(wavelength, 
-                                   plot_emissivity - plot_uncertainty,
-                                   plot_emissivity + plot_uncertainty,
-                                   alpha=0.2, color=color)
+            # Band vertices only change with normalization or offset
+            band_key = (normalize, offset_value)
+            if info['band_key'] != band_key:
+                info['band_verts'] = np.concatenate([
+                    np.column_stack((wavelength, plot_emissivity + uncertainty)),
+                    np.column_stack((wavelength[::-1], (plot_emissivity - uncertainty)[::-1]))
+                ])
+                band.set_verts([info['band_verts']])
+                info['band_key'] = band_key
+            band.set_visible(show_uncertainty)
+            if show_uncertainty:
+                visible_bands.append(info['band_verts'])
             
             offset_value += offset_increment
         
+        self._no_visible_text.set_visible(not visible_lines)
+        
         # Get theme colors for styling
         theme_colors = self.get_theme_colors()
         
-        # Apply theme-aware styling
-        self.ax.set_xlabel('Wavelength (μm)', fontsize=12, color=theme_colors['text'])
-        ylabel = 'Normalized Emissivity' if self.normalize_var.get() else 'Emissivity'
+        # Layout only needs recomputing when the label or legend text changes
+        layout_changed = False
+        
+        ylabel = 'Normalized Emissivity' if normalize else 'Emissivity'
         if self.offset_var.get():
             ylabel += ' (offset)'
-        self.ax.set_ylabel(ylabel, fontsize=12, color=theme_colors['text'])
-        self.ax.set_title('Multi-Spectrum Comparison', fontsize=14, color=theme_colors['text'])
+        if self.ax.get_ylabel() != ylabel:
+            self.ax.set_ylabel(ylabel, fontsize=12)
+            layout_changed = True
+        
+        # Apply theme-aware styling; recoloring is cheap and follows theme changes
+        self.ax.xaxis.label.set_color(theme_colors['text'])
+        self.ax.yaxis.label.set_color(theme_colors['text'])
+        self.ax.title.set_color(theme_colors['text'])
         self.ax.grid(True, alpha=0.3, color=theme_colors['grid'])
         self.ax.tick_params(colors=theme_colors['text'])
-        self.ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        
+        # Build the legend once per set of spectra; hidden spectra are dimmed
+        if self._legend is None:
+            self._build_legend()
+            layout_changed = True
+        for info in self.loaded_spectra.values():
+            info['legend_handle'].set_alpha(1.0 if info['visible'] else 0.3)
+        
+        # Rescale to the visible data; collections are not covered by relim
+        self.ax.relim(visible_only=True)
+        for verts in visible_bands:
+            self.ax.update_datalim(verts)
+        self.ax.autoscale_view()
         
         # Adjust layout
-        self.fig.tight_layout()
-        self.canvas.draw()
+        if layout_changed:
+            self.fig.tight_layout()
     
     def save_plot(self):
         """Save plot to file"""
@@ -452,26 +578,25 @@ class MultiSpectrumViewer:
         
         if file_path:
             try:
-                # Combine all spectrum data
-                combined_data = []
+                # Combine all spectrum data column-wise from the full-precision
+                # DataFrames, skipping pd.concat's index alignment
+                spectra = list(self.loaded_spectra.items())
+                lengths = [len(info['data']) for _, info in spectra]
                 
-                for name, info in self.loaded_spectra.items():
-                    spectrum_df = info['data'].copy()
-                    spectrum_df['Spectrum_Name'] = name
-                    spectrum_df['Spectrum_Type'] = info['type']
-                    spectrum_df['Wavelength'] = 10000 / spectrum_df['Wavenumber']
-                    combined_data.append(spectrum_df)
-                
-                if combined_data:
-                    export_df = pd.concat(combined_data, ignore_index=True)
-                    
-                    # Reorder columns
-                    columns = ['Spectrum_Name', 'Spectrum_Type', 'Wavenumber', 'Wavelength', 'Emissivity', 'Uncertainty']
-                    export_df = export_df[columns]
+                if spectra:
+                    wavenumber = np.concatenate([info['data']['Wavenumber'].to_numpy() for _, info in spectra])
+                    export_df = pd.DataFrame({
+                        'Spectrum_Name': np.repeat([name for name, _ in spectra], lengths),
+                        'Spectrum_Type': np.repeat([info['type'] for _, info in spectra], lengths),
+                        'Wavenumber': wavenumber,
+                        'Wavelength': 10000 / wavenumber,
+                        'Emissivity': np.concatenate([info['data']['Emissivity'].to_numpy() for _, info in spectra]),
+                        'Uncertainty': np.concatenate([info['data']['Uncertainty'].to_numpy() for _, info in spectra])
+                    }, copy=False)
                     
                     # Save to file
                     if file_path.endswith('.xlsx'):
-                        export_df.to_excel(file_path, index=False)
+                        ExcelExporter.write_sheets(file_path, [('Sheet1', export_df)])
                     else:
                         export_df.to_csv(file_path, index=False)
                     
@@ -2,16 +2,50 @@
 Results tab for the Mineral Spectra Analyzer
 """
 
+import csv
 import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from tkinter import messagebox, filedialog
 import numpy as np
 import pandas as pd
 import ttkbootstrap as tb
-from ttkbootstrap.scrolled import ScrolledFrame
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from scipy.interpolate import CubicSpline
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from core.excel_writer import ExcelExporter
+
+
+# Light and dark ttkbootstrap themes, used to pick plot colors
+LIGHT_THEMES = frozenset({
+    'cosmo', 'flatly', 'journal', 'litera', 'lumen', 'minty', 
+    'pulse', 'sandstone', 'united', 'yeti', 'morph', 'simplex',
+    'cerulean', 'spacelab', 'default'
+})
+
+DARK_THEMES = frozenset({
+    'cyborg', 'darkly', 'slate', 'solar', 'superhero', 'vapor',
+    'quartz', 'theme'  # Add any custom dark themes
+})
+
+# Relative positions of the five secondary-axis ticks within the view
+TICK_FRACTIONS = np.linspace(0.0, 1.0, num=5)
+
+# Fixed column types for the exported summary sheet
+SUMMARY_DTYPES = {
+    'RMS_Error': 'float64',
+    'Total_Selected_EndMembers': 'int32',
+    'EndMembers_Used_in_Fit': 'int32'
+}
+
+# File types offered when saving an individual plot
+PLOT_FILE_TYPES = [
+    ("PNG Image", "*.png"),
+    ("PDF Document", "*.pdf"), 
+    ("SVG Image", "*.svg"),
+    ("JPEG Image", "*.jpg")
+]
 
 
 class ResultsTab:
@@ -22,40 +56,56 @@ class ResultsTab:
         self.update_status = status_callback
         self.data_manager = data_manager
         
+        # Individual plot kinds for saving: builder and figure size
+        self._plot_builders = {
+            'spectral_fit': (self._build_spectral_fit_plot, (10, 6)),
+            'residuals': (self._build_residuals_plot, (8, 6)),
+            'histogram': (self._build_histogram_plot, (8, 6))
+        }
+        
+        # Per-tab state (results, container, plots, plot_data) keyed by tab id
+        self._tabs = {}
+        
+        # Figures drawn by create_plot, keyed by parent widget
+        self._plot_cache = {}
+        
+        # Plot colors per theme name; the active theme is looked up again
+        # only after a theme change
+        self._theme_cache = {}
+        self._active_theme = None
+        
         # Create main frame
         self.frame = tb.Frame(parent)
+        self.frame.bind_all("<<ThemeChanged>>", self._on_theme_changed, add="+")
         self.setup_ui()
     
     def get_theme_colors(self):
         """Get appropriate colors based on current theme"""
         try:
-            current_theme = tb.Style().theme.name.lower()
+            if self._active_theme is None:
+                self._active_theme = tb.Style().theme.name.lower()
+            current_theme = self._active_theme
             
-            # Define light and dark themes
-            light_themes = {
-                'cosmo', 'flatly', 'journal', 'litera', 'lumen', 'minty', 
-                'pulse', 'sandstone', 'united', 'yeti', 'morph', 'simplex',
-                'cerulean', 'spacelab', 'default'
-            }
-            
-            dark_themes = {
-                'cyborg', 'darkly', 'slate', 'solar', 'superhero', 'vapor',
-                'quartz', 'theme'  # Add any custom dark themes
-            }
+            cached = self._theme_cache.get(current_theme)
+            if cached is not None:
+                return cached
             
             # Determine if current theme is dark or light
-            if current_theme in dark_themes:
-                return {
+            if current_theme in DARK_THEMES:
+                colors = {
                     'text': 'white',
                     'grid': 'lightgray',
                     'line': 'white'
                 }
             else:  # Default to light theme colors
-                return {
+                colors = {
                     'text': 'black',
                     'grid': 'gray',
                     'line': 'black'
                 }
+            
+            self._theme_cache[current_theme] = colors
+            return colors
         except:
             # Fallback to light theme colors if detection fails
             return {
@@ -64,15 +114,22 @@ class ResultsTab:
                 'line': 'black'
             }
     
+    def _on_theme_changed(self, event=None):
+        """Forget the cached theme colors"""
+        self._theme_cache.clear()
+        self._active_theme = None
+    
     def setup_ui(self):
         """Setup the interactive results tab UI"""
         # Create notebook for results
         self.results_notebook = tb.Notebook(self.frame)
         self.results_notebook.pack(fill="both", expand=True, padx=5, pady=5)
+        self.results_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
-        # Create placeholder tab
+        # Create placeholder tab; it is hidden, never destroyed, while results are shown
         placeholder = tb.Frame(self.results_notebook)
         self.results_notebook.add(placeholder, text="No Results")
+        self._placeholder_tab = placeholder
         
         # Create centered message with better styling
         message_frame = tb.Frame(placeholder)
@@ -115,12 +172,24 @@ class ResultsTab:
     def create_results_tab(self, algorithm, mineral, endmembers, abundances, errors, 
                           bestfit, reserror, meanspec, measurerr, wavenumber, RMS, 
                           maxwl=None, normalized_abundances=None, all_selected_endmembers=None,
-                          mixed_spectrum_data=None, endmember_spectral_data=None):
-        """Create an interactive results dashboard"""
-        # Remove placeholder tab if it exists
-        if len(self.results_notebook.tabs()) == 1 and \
-           self.results_notebook.tab(0, "text") == "No Results":
-            self.results_notebook.forget(0)
+                          mixed_spectrum_data=None, endmember_spectral_data=None, replace=False):
+        """Create an interactive results dashboard
+        
+        Each run gets its own tab so runs can be compared. With replace=True the
+        latest tab of the same algorithm and sample is updated in place instead.
+        """
+        # Hide placeholder tab
+        self.results_notebook.hide(self._placeholder_tab)
+        
+        tab_title = f"{algorithm}_{mineral}"
+        tab_id = self._find_result_tab(tab_title) if replace else None
+        previous = self._tabs[tab_id]['results'] if tab_id is not None else {}
+        
+        # Wavelength and uncertainty band edges are derived once for the plots
+        # and every save; only a replaced result's buffers are written over
+        wavelength = np.divide(10000.0, wavenumber, out=self._reusable(previous, 'wavelength', wavenumber))
+        upper = np.add(meanspec, measurerr, out=self._reusable(previous, 'upper', meanspec))
+        lower = np.subtract(meanspec, measurerr, out=self._reusable(previous, 'lower', meanspec))
         
         # Store results data for this tab
         self.current_results = {
@@ -134,6 +203,9 @@ class ResultsTab:
             'meanspec': meanspec,
             'measurerr': measurerr,
             'wavenumber': wavenumber,
+            'wavelength': wavelength,
+            'upper': upper,
+            'lower': lower,
             'RMS': RMS,
             'maxwl': maxwl,
             'normalized_abundances': normalized_abundances,
@@ -142,19 +214,74 @@ class ResultsTab:
             'endmember_spectral_data': endmember_spectral_data
         }
         
-        # Create a new tab frame
-        result_tab = tb.Frame(self.results_notebook)
-        tab_title = f"{algorithm}_{mineral}"
-        self.results_notebook.add(result_tab, text=tab_title)
-        self.results_notebook.select(self.results_notebook.index("end") - 1)
+        if tab_id is None:
+            result_tab = tb.Frame(self.results_notebook)
+            self.results_notebook.add(result_tab, text=tab_title)
+            tab_id = str(result_tab)
+            self._tabs[tab_id] = {'results': self.current_results}
+            self._build_tab(tab_id)
+        else:
+            self._tabs[tab_id]['results'] = self.current_results
+            self._refresh_tab(tab_id)
+        
+        # Show the new result and make it the one exports act on
+        self.results_notebook.select(tab_id)
+        self._on_tab_changed()
+    
+    @staticmethod
+    def _reusable(previous, key, like):
+        """Return previous[key] if it can hold a result shaped like `like`, else None"""
+        buffer = previous.get(key)
+        if buffer is not None and buffer.shape == np.shape(like):
+            return buffer
+        return None
+    
+    def _find_result_tab(self, tab_title):
+        """Return the id of the newest result tab with the given title, or None"""
+        for tab_id in reversed(list(self._tabs)):
+            if self.results_notebook.tab(tab_id, "text") == tab_title:
+                return tab_id
+        return None
+    
+    def close_result_tab(self, tab_id=None):
+        """Close a result tab, the selected one by default"""
+        tab_id = tab_id or self.results_notebook.select()
+        if tab_id not in self._tabs:
+            return
         
-        # Create scrollable content inside the tab
-        scrolled_frame = ScrolledFrame(result_tab, autohide=True)
-        scrolled_frame.pack(fill="both", expand=True, padx=5, pady=5)
+        result_tab = self.results_notebook.nametowidget(tab_id)
+        del self._tabs[tab_id]
+        self.results_notebook.forget(tab_id)
+        result_tab.destroy()
+        
+        if not self._tabs:
+            # Show the placeholder again and forget the last result
+            self.results_notebook.add(self._placeholder_tab)
+            for attr in ('current_results', 'plot_data'):
+                if hasattr(self, attr):
+                    delattr(self, attr)
+    
+    def _on_tab_changed(self, event=None):
+        """Make the selected tab's result the one exports and saves act on"""
+        state = self._tabs.get(self.results_notebook.select())
+        if state is None:
+            return
         
-        # Main container
-        main_container = scrolled_frame.container
+        self.current_results = state['results']
+        if 'plot_data' in state:
+            self.plot_data = state['plot_data']
+    
+    def _build_tab(self, tab_id):
+        """Build the dashboard of a new result tab"""
+        state = self._tabs[tab_id]
+        results = state['results']
+        result_tab = self.results_notebook.nametowidget(tab_id)
+        
+        # Main container; the layout is fixed, so only the abundance table scrolls
+        main_container = tb.Frame(result_tab)
+        main_container.pack(fill="both", expand=True, padx=5, pady=5)
         main_container.grid_columnconfigure(0, weight=1)
+        state['container'] = main_container
         
         # Configure rows for simplified layout - maximize spectral plots
         main_container.grid_rowconfigure(0, weight=0)  # Header (minimal)
@@ -163,11 +290,52 @@ class ResultsTab:
         main_container.grid_rowconfigure(3, weight=0)  # Export section (minimal)
         
         # Create simplified dashboard
-        self.create_dashboard_header(main_container, algorithm, mineral, RMS)
-        self.create_abundance_table(main_container, algorithm, endmembers, abundances, errors, normalized_abundances)
-        self.create_spectral_plots(main_container, mineral, algorithm, wavenumber, meanspec, bestfit, reserror, measurerr)
+        self._build_summary(main_container, results)
+        self._build_plots(state, results)
         self.create_export_section(main_container)
     
+    def _refresh_tab(self, tab_id):
+        """Show a new analysis in an already built tab, updating its figure in place"""
+        state = self._tabs[tab_id]
+        results = state['results']
+        container = state['container']
+        
+        # Header and table are small, so they are simply rebuilt
+        for widget in container.grid_slaves(row=0) + container.grid_slaves(row=1):
+            widget.destroy()
+        self._build_summary(container, results)
+        
+        plots = state.get('plots')
+        if plots is None or plots['has_err'] != self._has_uncertainty(results['measurerr']):
+            # The plots failed to build last time, or the uncertainty bands
+            # appear or disappear; build the figure again from scratch
+            for widget in container.grid_slaves(row=2):
+                widget.destroy()
+            self._build_plots(state, results)
+            return
+        
+        self._update_spectral_plots(state['plots'], state['plot_data'], results['wavelength'],
+                                    results['meanspec'], results['bestfit'],
+                                    results['reserror'], results['measurerr'],
+                                    results['lower'], results['upper'])
+    
+    def _build_summary(self, container, results):
+        """Create the header and abundance table of a result tab"""
+        self.create_dashboard_header(container, results['algorithm'], results['mineral'], results['RMS'])
+        self.create_abundance_table(container, results['algorithm'], results['endmembers'],
+                                    results['abundances'], results['errors'],
+                                    results['normalized_abundances'])
+    
+    def _build_plots(self, state, results):
+        """Create the spectral plots of a result tab and remember their artists"""
+        state['plots'] = self.create_spectral_plots(state['container'], results['mineral'],
+                                                    results['algorithm'], results['wavelength'],
+                                                    results['meanspec'], results['bestfit'],
+                                                    results['reserror'], results['measurerr'],
+                                                    results['lower'], results['upper'])
+        if state['plots'] is not None:
+            state['plot_data'] = self.plot_data
+    
     def create_dashboard_header(self, parent, algorithm, mineral, RMS):
         """Create a compact header with essential information"""
         header_frame = tb.Labelframe(parent, text="Analysis Summary", padding=5)
@@ -193,43 +361,53 @@ class ResultsTab:
         table_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=5)
         
         # Create table with headers
+        show_normalized = algorithm == 'STO' and normalized_abundances is not None
         headers = ["End-Member", "Abundance", "Error", "Relative Error (%)"]
-        if algorithm == 'STO' and normalized_abundances is not None:
+        if show_normalized:
             headers.insert(-1, "Normalized")
         
-        # Header row
-        for i, header in enumerate(headers):
-            tb.Label(table_frame, text=header, font=("TkDefaultFont", 10, "bold"), 
-                    bootstyle="info").grid(row=0, column=i, padx=5, pady=5, sticky="ew")
+        # Single Treeview instead of one Label widget per cell
+        columns = headers[1:]
+        tree = tb.Treeview(table_frame, columns=columns, show="tree headings",
+                           bootstyle="info", height=min(10, len(endmembers)))
+        scrollbar = tb.Scrollbar(table_frame, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        
+        tree.heading("#0", text=headers[0], anchor="w")
+        tree.column("#0", width=150, anchor="w")
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=110, anchor="center")
+        
+        # Color code rows by relative error
+        style_colors = tb.Style().colors
+        tree.tag_configure("success", foreground=style_colors.success)
+        tree.tag_configure("warning", foreground=style_colors.warning)
+        tree.tag_configure("danger", foreground=style_colors.danger)
+        
+        # Format every column in one pass
+        abundances = np.asarray(abundances, dtype=float)
+        errors = np.asarray(errors, dtype=float)
+        positive = abundances > 0
+        rel_errors = np.divide(errors * 100, abundances, out=np.zeros_like(errors), where=positive)
+        rel_error_tags = np.where(rel_errors < 10, "success", np.where(rel_errors < 25, "warning", "danger"))
+        
+        value_columns = [np.char.mod('%.4f', abundances), np.char.mod('±%.4f', errors)]
+        if show_normalized:
+            value_columns.append(np.char.mod('%.4f', np.asarray(normalized_abundances, dtype=float)))
+        value_columns.append(np.char.mod('%.1f%%', rel_errors))
         
         # Data rows
         em_names = [str(em) for em in endmembers]
-        for i, (em, abundance, error) in enumerate(zip(em_names, abundances, errors)):
-            rel_error = (error / abundance * 100) if abundance > 0 else 0
-            
-            # End-member name
-            tb.Label(table_frame, text=em).grid(row=i+1, column=0, padx=5, pady=2, sticky="w")
-            
-            # Abundance
-            tb.Label(table_frame, text=f"{abundance:.4f}").grid(row=i+1, column=1, padx=5, pady=2)
-            
-            # Error
-            tb.Label(table_frame, text=f"±{error:.4f}").grid(row=i+1, column=2, padx=5, pady=2)
-            
-            # Normalized abundance (if STO)
-            col_offset = 0
-            if algorithm == 'STO' and normalized_abundances is not None:
-                tb.Label(table_frame, text=f"{normalized_abundances[i]:.4f}").grid(
-                    row=i+1, column=3, padx=5, pady=2)
-                col_offset = 1
-            
-            # Relative error (color coded)
-            rel_error_color = "success" if rel_error < 10 else "warning" if rel_error < 25 else "danger"
-            tb.Label(table_frame, text=f"{rel_error:.1f}%", 
-                    bootstyle=rel_error_color).grid(row=i+1, column=3+col_offset, padx=5, pady=2)
+        for em, values, rel_error_tag in zip(em_names, zip(*value_columns), rel_error_tags):
+            tree.insert("", "end", text=em, values=values, tags=(str(rel_error_tag),))
+        
+        scrollbar.pack(side="right", fill="y")
+        tree.pack(side="left", fill="x", expand=True)
     
     
-    def create_spectral_plots(self, parent, mineral, algorithm, wavenumber, meanspec, bestfit, reserror, measurerr):
+    def create_spectral_plots(self, parent, mineral, algorithm, wavelength, meanspec, bestfit, reserror, measurerr,
+                              lower, upper):
         """Create interactive spectral plots"""
         try:
             plots_frame = tb.Labelframe(parent, text="Spectral Analysis", padding=15)
@@ -238,88 +416,88 @@ class ResultsTab:
             plots_frame.grid_columnconfigure(0, weight=1)
             
             print(f"Creating spectral plots for {mineral} using {algorithm}")
-            print(f"Data shapes - wavenumber: {wavenumber.shape}, meanspec: {meanspec.shape}, bestfit: {bestfit.shape}")
+            print(f"Data shapes - wavelength: {wavelength.shape}, meanspec: {meanspec.shape}, bestfit: {bestfit.shape}")
             
             # Get theme-appropriate colors
             colors = self.get_theme_colors()
             
-            # Create figure with subplots - even larger size for better visibility
-            fig = Figure(figsize=(16, 12), dpi=80, facecolor='none', edgecolor='none')
-            
-            # Convert wavenumber to wavelength
-            wavelength = 10000 / wavenumber
+            # Create figure with subplots, sized to the width the tab really has
+            # so the Agg buffer matches the widget instead of a fixed 16x12 inches
+            dpi = 80
+            width_px = self._plot_width_px()
+            fig = Figure(figsize=(width_px / dpi, width_px * 0.75 / dpi), dpi=dpi,
+                         facecolor='none', edgecolor='none')
             
             # Adjust subplot spacing manually
             fig.subplots_adjust(left=0.08, bottom=0.1, right=0.95, top=0.92, wspace=0.25, hspace=0.35)
             
+            # Residual statistics are computed once and reused by the saves
+            stats = self._residual_stats(reserror)
+            counts, bin_edges = stats['hist_counts'], stats['hist_edges']
+            
+            # Decimate long spectra for display; full arrays are kept in plot_data
+            has_err = self._has_uncertainty(measurerr)
+            display = self._display_arrays(wavelength, meanspec, bestfit, reserror, measurerr, lower, upper, has_err)
+            bands = {}
+            
             # Main fit plot (spans top row)
             ax1 = fig.add_subplot(2, 2, (1, 2))
-            ax1.set_facecolor('none')  # Transparent background
-            ax1.plot(wavelength, meanspec, color=colors['line'], linewidth=2, label='Observed', alpha=0.8)
-            ax1.plot(wavelength, bestfit, 'r-', linewidth=2, label='Model Fit')
-            ax1.fill_between(wavelength, meanspec - measurerr, meanspec + measurerr, 
-                            alpha=0.3, color='gray', label='Uncertainty')
+            self._style_axes(ax1, colors)
+            obs_line, = ax1.plot(*display['obs'], color=colors['line'], linewidth=2, label='Observed', alpha=0.8)
+            fit_line, = ax1.plot(*display['fit'], 'r-', linewidth=2, label='Model Fit')
+            if has_err:
+                bands['band'] = ax1.fill_between(*display['band'], 
+                                                 alpha=0.3, color='gray', label='Uncertainty')
             
             ax1.set_xlabel('Wavelength (μm)', fontsize=11, color=colors['text'])
             ax1.set_ylabel('Emissivity', fontsize=11, color=colors['text'])
             ax1.set_title(f'Spectral Fit: {algorithm} Analysis of {mineral}', fontsize=12, fontweight='bold', color=colors['text'])
             ax1.legend(fontsize=10)
             ax1.grid(True, alpha=0.3, color=colors['grid'])
-            ax1.tick_params(colors=colors['text'])
-            ax1.spines['bottom'].set_color(colors['line'])
-            ax1.spines['top'].set_color(colors['line'])
-            ax1.spines['left'].set_color(colors['line'])
-            ax1.spines['right'].set_color(colors['line'])
             # Normal x-axis direction
             
             # Residual plot (bottom left)
             ax2 = fig.add_subplot(2, 2, 3)
-            ax2.set_facecolor('none')  # Transparent background
-            ax2.plot(wavelength, reserror, 'b-', linewidth=1, alpha=0.7)
+            self._style_axes(ax2, colors)
+            res_line, = ax2.plot(*display['res'], 'b-', linewidth=1, alpha=0.7)
             ax2.axhline(y=0, color=colors['line'], linestyle='--', alpha=0.5)
-            ax2.fill_between(wavelength, -measurerr, measurerr, alpha=0.2, color='gray')
+            if has_err:
+                bands['err'] = ax2.fill_between(*display['err'], alpha=0.2, color='gray')
             
             ax2.set_xlabel('Wavelength (μm)', fontsize=11, color=colors['text'])
             ax2.set_ylabel('Residual', fontsize=11, color=colors['text'])
             ax2.set_title('Fit Residuals', fontsize=12, fontweight='bold', color=colors['text'])
             ax2.grid(True, alpha=0.3, color=colors['grid'])
-            ax2.tick_params(colors=colors['text'])
-            ax2.spines['bottom'].set_color(colors['line'])
-            ax2.spines['top'].set_color(colors['line'])
-            ax2.spines['left'].set_color(colors['line'])
-            ax2.spines['right'].set_color(colors['line'])
             # Normal x-axis direction
             
             # Residual histogram (bottom right)
             ax3 = fig.add_subplot(2, 2, 4)
-            ax3.set_facecolor('none')  # Transparent background
-            n, bins, patches = ax3.hist(reserror, bins=20, alpha=0.7, color='blue', edgecolor=colors['line'])
+            self._style_axes(ax3, colors)
+            bars = ax3.bar(bin_edges[:-1], counts, width=np.diff(bin_edges), align='edge', 
+                           alpha=0.7, color='blue', edgecolor=colors['line'])
             ax3.axvline(x=0, color=colors['line'], linestyle='--', alpha=0.5)
-            ax3.axvline(x=np.mean(reserror), color='r', linestyle='-', alpha=0.7, label=f'Mean: {np.mean(reserror):.4f}')
+            mean_line = ax3.axvline(x=stats['res_mean'], color='r', linestyle='-', alpha=0.7,
+                                    label=self._mean_label(stats))
             
             ax3.set_xlabel('Residual Value', fontsize=11, color=colors['text'])
             ax3.set_ylabel('Frequency', fontsize=11, color=colors['text'])
             ax3.set_title('Residual Distribution', fontsize=12, fontweight='bold', color=colors['text'])
             ax3.legend(fontsize=10)
             ax3.grid(True, alpha=0.3, color=colors['grid'])
-            ax3.tick_params(colors=colors['text'])
-            ax3.spines['bottom'].set_color(colors['line'])
-            ax3.spines['top'].set_color(colors['line'])
-            ax3.spines['left'].set_color(colors['line'])
-            ax3.spines['right'].set_color(colors['line'])
             
             # Manual spacing is already set with subplots_adjust above
             
             # Add to GUI
             canvas = FigureCanvasTkAgg(fig, plots_frame)
             canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-            canvas.draw()  # Explicitly draw the canvas
+            # Defer rendering to idle time so the remaining setup collapses into one draw
+            canvas.draw_idle()
             
-            # Add matplotlib toolbar
+            # Add matplotlib toolbar the first time the pointer enters the plots
             toolbar_frame = tb.Frame(plots_frame)
             toolbar_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=5)
-            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
-            toolbar.update()
+            plots_frame.bind("<Enter>", 
+                             lambda e: self._ensure_toolbar(plots_frame, canvas, toolbar_frame))
             
             # Store plot data for individual saving
             self.plot_data = {
@@ -328,18 +506,33 @@ class ResultsTab:
                 'bestfit': bestfit,
                 'reserror': reserror,
                 'measurerr': measurerr,
+                'lower': lower,
+                'upper': upper,
+                'has_err': has_err,
                 'mineral': mineral,
                 'algorithm': algorithm,
-                'colors': colors
+                'colors': colors,
+                **stats
             }
             
             # Add custom save buttons for individual plots in separate frame below toolbar
             save_buttons_frame = tb.Frame(plots_frame)
             save_buttons_frame.grid(row=2, column=0, sticky="ew", padx=5, pady=5)
-            self.add_individual_save_buttons(save_buttons_frame, fig, ax1, ax2, ax3, mineral, algorithm)
+            self.add_individual_save_buttons(save_buttons_frame, f"{mineral}_{algorithm}")
             
             print("✓ Spectral plots created successfully")
             
+            # Artists updated in place when the analysis is re-run
+            return {
+                'canvas': canvas,
+                'axes': (ax1, ax2, ax3),
+                'lines': {'obs': obs_line, 'fit': fit_line, 'res': res_line},
+                'bands': bands,
+                'has_err': has_err,
+                'bars': bars,
+                'mean_line': mean_line
+            }
+            
         except Exception as e:
             print(f"✗ Error creating spectral plots: {e}")
             import traceback
@@ -351,9 +544,148 @@ class ResultsTab:
             
             tb.Label(error_frame, text=f"Error creating plots: {str(e)}", 
                     bootstyle="danger").pack(pady=10)
+            return None
     
-    def add_individual_save_buttons(self, save_frame, fig, ax1, ax2, ax3, mineral, algorithm):
-        """Add individual save buttons for each plot"""
+    def _ensure_toolbar(self, plots_frame, canvas, toolbar_frame):
+        """Create the navigation toolbar of a result figure once"""
+        plots_frame.unbind("<Enter>")
+        if not toolbar_frame.winfo_children():
+            toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
+            toolbar.update()
+    
+    def _plot_width_px(self):
+        """Pixel width available for a result figure, 1280 while the notebook is not shown"""
+        self.results_notebook.update_idletasks()
+        if not self.results_notebook.winfo_ismapped():
+            return 1280
+        # Leave room for the frame paddings around the canvas
+        return max(self.results_notebook.winfo_width() - 60, 480)
+    
+    def _update_spectral_plots(self, plots, plot_data, wavelength, meanspec, bestfit, reserror, measurerr,
+                               lower, upper):
+        """Replace the data of an existing spectral figure and redraw it"""
+        ax1, ax2, ax3 = plots['axes']
+        stats = self._residual_stats(reserror)
+        bin_edges = stats['hist_edges']
+        display = self._display_arrays(wavelength, meanspec, bestfit, reserror, measurerr, lower, upper,
+                                       plots['has_err'])
+        
+        for key, line in plots['lines'].items():
+            line.set_data(*display[key])
+        
+        # Band polygons are replaced in place rather than rebuilt by fill_between
+        band_verts = {key: self._band_verts(*display[key]) for key in plots['bands']}
+        for key, collection in plots['bands'].items():
+            collection.set_verts([band_verts[key]])
+        
+        for rect, left, width, height in zip(plots['bars'], bin_edges[:-1], np.diff(bin_edges), stats['hist_counts']):
+            rect.set_x(left)
+            rect.set_width(width)
+            rect.set_height(height)
+        plots['mean_line'].set_xdata([stats['res_mean'], stats['res_mean']])
+        plots['mean_line'].set_label(self._mean_label(stats))
+        ax3.legend(fontsize=10)
+        
+        # relim ignores collections, so the bands are added to the data limits by hand
+        for ax in plots['axes']:
+            ax.relim()
+        for key, ax in (('band', ax1), ('err', ax2)):
+            if key in band_verts:
+                ax.update_datalim(band_verts[key])
+        for ax in plots['axes']:
+            ax.autoscale_view()
+        
+        plots['canvas'].draw_idle()
+        
+        plot_data.update({
+            'wavelength': wavelength,
+            'meanspec': meanspec,
+            'bestfit': bestfit,
+            'reserror': reserror,
+            'measurerr': measurerr,
+            'lower': lower,
+            'upper': upper,
+            **stats
+        })
+    
+    @staticmethod
+    def _residual_stats(reserror):
+        """Mean, standard deviation and 20-bin histogram of the residuals"""
+        hist_counts, hist_edges = np.histogram(reserror, bins=20)
+        return {
+            'res_mean': float(np.mean(reserror)),
+            'res_std': float(np.std(reserror)),
+            'hist_counts': hist_counts,
+            'hist_edges': hist_edges
+        }
+    
+    @staticmethod
+    def _mean_label(stats):
+        """Legend label of the residual mean line"""
+        return f"Mean: {stats['res_mean']:.4f}"
+    
+    @staticmethod
+    def _decimation_bins(n, target):
+        """Start indices of about target equal bins, or None if n points can be drawn as-is"""
+        if n <= 2 * target:
+            return None
+        return np.arange(0, n, -(-n // target))
+    
+    @staticmethod
+    def _decimate(x, y, target=2000):
+        """Min/max-decimate a trace for display, keeping each bin's extremes"""
+        starts = ResultsTab._decimation_bins(len(x), target)
+        if starts is None:
+            return x, y
+        
+        # Each bin contributes its minimum and maximum at the bin start
+        x_out = np.repeat(x[starts], 2)
+        y_out = np.column_stack((np.minimum.reduceat(y, starts),
+                                 np.maximum.reduceat(y, starts))).ravel()
+        return x_out, y_out
+    
+    @staticmethod
+    def _decimate_band(x, lower, upper, target=2000):
+        """Decimate a fill band, keeping the lowest lower and highest upper edge of each bin"""
+        starts = ResultsTab._decimation_bins(len(x), target)
+        if starts is None:
+            return x, lower, upper
+        return x[starts], np.minimum.reduceat(lower, starts), np.maximum.reduceat(upper, starts)
+    
+    @staticmethod
+    def _style_axes(ax, colors):
+        """Give ax a transparent background and theme-colored ticks and spines"""
+        ax.set_facecolor('none')
+        ax.tick_params(colors=colors['text'])
+        for spine in ax.spines.values():
+            spine.set_color(colors['line'])
+    
+    @staticmethod
+    def _has_uncertainty(measurerr):
+        """Whether measurerr is large enough anywhere for an uncertainty band to show"""
+        return bool(np.any(measurerr > 1e-12))
+    
+    @staticmethod
+    def _display_arrays(wavelength, meanspec, bestfit, reserror, measurerr, lower, upper, has_err=True):
+        """Decimated (x, y) traces and, with has_err, (x, lower, upper) bands drawn by the dashboard"""
+        display = {
+            'obs': ResultsTab._decimate(wavelength, meanspec),
+            'fit': ResultsTab._decimate(wavelength, bestfit),
+            'res': ResultsTab._decimate(wavelength, reserror)
+        }
+        if has_err:
+            display['band'] = ResultsTab._decimate_band(wavelength, lower, upper)
+            display['err'] = ResultsTab._decimate_band(wavelength, -measurerr, measurerr)
+        return display
+    
+    @staticmethod
+    def _band_verts(x, lower, upper):
+        """Closed polygon outline of a fill_between band"""
+        return np.concatenate((np.column_stack((x, lower)),
+                               np.column_stack((x[::-1], upper[::-1]))))
+    
+    def add_individual_save_buttons(self, save_frame, base):
+        """Add individual save buttons for each plot, naming files after base"""
         # Add a label for the save section
         tb.Label(save_frame, text="Save Individual Plots:", 
                 font=("TkDefaultFont", 9, "bold")).pack(side="left", padx=(5, 10))
@@ -361,168 +693,128 @@ class ResultsTab:
         # Individual plot save buttons
         tb.Button(save_frame, text="Save Spectral Fit", 
                  bootstyle="info-outline", 
-                 command=lambda: self.save_spectral_fit_plot(f"{mineral}_{algorithm}_spectral_fit")).pack(side="left", padx=2)
+                 command=lambda b=base: self.save_spectral_fit_plot(f"{b}_spectral_fit")).pack(side="left", padx=2)
         
         tb.Button(save_frame, text="Save Residuals", 
                  bootstyle="info-outline",
-                 command=lambda: self.save_residuals_plot(f"{mineral}_{algorithm}_residuals")).pack(side="left", padx=2)
+                 command=lambda b=base: self.save_residuals_plot(f"{b}_residuals")).pack(side="left", padx=2)
         
         tb.Button(save_frame, text="Save Histogram", 
                  bootstyle="info-outline",
-                 command=lambda: self.save_histogram_plot(f"{mineral}_{algorithm}_histogram")).pack(side="left", padx=2)
+                 command=lambda b=base: self.save_histogram_plot(f"{b}_histogram")).pack(side="left", padx=2)
         
         # Save all plots button with separator
         tb.Separator(save_frame, orient="vertical").pack(side="left", padx=10, fill="y")
         tb.Button(save_frame, text="Save All Plots", 
                  bootstyle="success-outline",
-                 command=lambda: self.save_all_individual_plots(fig, ax1, ax2, ax3, mineral, algorithm)).pack(side="left", padx=5)
+                 command=lambda b=base: self.save_all_individual_plots(b)).pack(side="left", padx=5)
     
-    def save_spectral_fit_plot(self, default_filename):
-        """Save the spectral fit plot"""
-        from tkinter import filedialog, messagebox
+    def _build_spectral_fit_plot(self, ax, data):
+        """Draw the spectral fit onto ax for saving"""
+        ax.plot(data['wavelength'], data['meanspec'], color='black', linewidth=2, label='Observed', alpha=0.8)
+        ax.plot(data['wavelength'], data['bestfit'], 'r-', linewidth=2, label='Model Fit')
+        if data['has_err']:
+            ax.fill_between(data['wavelength'], data['lower'], data['upper'], 
+                           alpha=0.3, color='gray', label='Uncertainty')
+        
+        ax.set_xlabel('Wavelength (μm)', fontsize=12)
+        ax.set_ylabel('Emissivity', fontsize=12)
+        ax.set_title(f'Spectral Fit: {data["algorithm"]} Analysis of {data["mineral"]}', fontsize=14, fontweight='bold')
+        ax.legend(fontsize=11)
+        ax.grid(True, alpha=0.3)
+    
+    def _build_residuals_plot(self, ax, data):
+        """Draw the fit residuals onto ax for saving"""
+        ax.plot(data['wavelength'], data['reserror'], 'b-', linewidth=1, alpha=0.7)
+        ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
+        if data['has_err']:
+            ax.fill_between(data['wavelength'], -data['measurerr'], data['measurerr'], alpha=0.2, color='gray')
+        
+        ax.set_xlabel('Wavelength (μm)', fontsize=12)
+        ax.set_ylabel('Residual', fontsize=12)
+        ax.set_title('Fit Residuals', fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+    
+    def _build_histogram_plot(self, ax, data):
+        """Draw the residual histogram onto ax for saving"""
+        ax.bar(data['hist_edges'][:-1], data['hist_counts'], width=np.diff(data['hist_edges']), align='edge', 
+               alpha=0.7, color='blue', edgecolor='black')
+        ax.axvline(x=0, color='black', linestyle='--', alpha=0.5)
+        ax.axvline(x=data['res_mean'], color='r', linestyle='-', alpha=0.7, 
+                  label=self._mean_label(data))
+        
+        ax.set_xlabel('Residual Value', fontsize=12)
+        ax.set_ylabel('Frequency', fontsize=12)
+        ax.set_title('Residual Distribution', fontsize=14, fontweight='bold')
+        ax.legend(fontsize=11)
+        ax.grid(True, alpha=0.3)
+    
+    def _save_plot(self, kind, file_path, data=None):
+        """
+        Render one individual plot on its own Figure and save it to file_path.
+        Pass data to draw something other than the current plot_data.
+        """
+        builder, figsize = self._plot_builders[kind]
+        
+        fig = Figure(figsize=figsize, dpi=300)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        builder(ax, self.plot_data if data is None else data)
         
+        fig.tight_layout()
+        fig.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    
+    def _save_single_plot(self, kind, default_filename, label):
+        """Ask for a file name and save one individual plot"""
         if not hasattr(self, 'plot_data'):
             messagebox.showerror("Error", "No plot data available")
             return
-            
-        file_types = [
-            ("PNG Image", "*.png"),
-            ("PDF Document", "*.pdf"), 
-            ("SVG Image", "*.svg"),
-            ("JPEG Image", "*.jpg")
-        ]
         
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=file_types,
+            filetypes=PLOT_FILE_TYPES,
             initialfile=default_filename
         )
         
         if file_path:
             try:
-                data = self.plot_data
-                fig = Figure(figsize=(10, 6), dpi=300)
-                ax = fig.add_subplot(111)
-                
-                # Recreate spectral fit plot
-                ax.plot(data['wavelength'], data['meanspec'], color='black', linewidth=2, label='Observed', alpha=0.8)
-                ax.plot(data['wavelength'], data['bestfit'], 'r-', linewidth=2, label='Model Fit')
-                ax.fill_between(data['wavelength'], 
-                               data['meanspec'] - data['measurerr'], 
-                               data['meanspec'] + data['measurerr'], 
-                               alpha=0.3, color='gray', label='Uncertainty')
-                
-                ax.set_xlabel('Wavelength (μm)', fontsize=12)
-                ax.set_ylabel('Emissivity', fontsize=12)
-                ax.set_title(f'Spectral Fit: {data["algorithm"]} Analysis of {data["mineral"]}', fontsize=14, fontweight='bold')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                fig.tight_layout()
-                fig.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                
-                messagebox.showinfo("Success", f"Spectral Fit Plot saved to:\n{file_path}")
+                self._save_plot(kind, file_path)
+                messagebox.showinfo("Success", f"{label} saved to:\n{file_path}")
                 
             except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save Spectral Fit Plot: {str(e)}")
+                messagebox.showerror("Save Error", f"Failed to save {label}: {str(e)}")
+    
+    def save_spectral_fit_plot(self, default_filename):
+        """Save the spectral fit plot"""
+        self._save_single_plot('spectral_fit', default_filename, "Spectral Fit Plot")
     
     def save_residuals_plot(self, default_filename):
         """Save the residuals plot"""
-        from tkinter import filedialog, messagebox
-        
-        if not hasattr(self, 'plot_data'):
-            messagebox.showerror("Error", "No plot data available")
-            return
-            
-        file_types = [
-            ("PNG Image", "*.png"),
-            ("PDF Document", "*.pdf"), 
-            ("SVG Image", "*.svg"),
-            ("JPEG Image", "*.jpg")
-        ]
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".png",
-            filetypes=file_types,
-            initialfile=default_filename
-        )
-        
-        if file_path:
-            try:
-                data = self.plot_data
-                fig = Figure(figsize=(8, 6), dpi=300)
-                ax = fig.add_subplot(111)
-                
-                # Recreate residuals plot
-                ax.plot(data['wavelength'], data['reserror'], 'b-', linewidth=1, alpha=0.7)
-                ax.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-                ax.fill_between(data['wavelength'], -data['measurerr'], data['measurerr'], alpha=0.2, color='gray')
-                
-                ax.set_xlabel('Wavelength (μm)', fontsize=12)
-                ax.set_ylabel('Residual', fontsize=12)
-                ax.set_title('Fit Residuals', fontsize=14, fontweight='bold')
-                ax.grid(True, alpha=0.3)
-                
-                fig.tight_layout()
-                fig.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                
-                messagebox.showinfo("Success", f"Residuals Plot saved to:\n{file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save Residuals Plot: {str(e)}")
+        self._save_single_plot('residuals', default_filename, "Residuals Plot")
     
     def save_histogram_plot(self, default_filename):
         """Save the histogram plot"""
-        from tkinter import filedialog, messagebox
-        
-        if not hasattr(self, 'plot_data'):
-            messagebox.showerror("Error", "No plot data available")
-            return
-            
-        file_types = [
-            ("PNG Image", "*.png"),
-            ("PDF Document", "*.pdf"), 
-            ("SVG Image", "*.svg"),
-            ("JPEG Image", "*.jpg")
-        ]
-        
-        file_path = filedialog.asksaveasfilename(
-            defaultextension=".png",
-            filetypes=file_types,
-            initialfile=default_filename
-        )
-        
-        if file_path:
-            try:
-                data = self.plot_data
-                fig = Figure(figsize=(8, 6), dpi=300)
-                ax = fig.add_subplot(111)
-                
-                # Recreate histogram plot
-                n, bins, patches = ax.hist(data['reserror'], bins=20, alpha=0.7, color='blue', edgecolor='black')
-                ax.axvline(x=0, color='black', linestyle='--', alpha=0.5)
-                ax.axvline(x=np.mean(data['reserror']), color='r', linestyle='-', alpha=0.7, 
-                          label=f'Mean: {np.mean(data["reserror"]):.4f}')
-                
-                ax.set_xlabel('Residual Value', fontsize=12)
-                ax.set_ylabel('Frequency', fontsize=12)
-                ax.set_title('Residual Distribution', fontsize=14, fontweight='bold')
-                ax.legend(fontsize=11)
-                ax.grid(True, alpha=0.3)
-                
-                fig.tight_layout()
-                fig.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                
-                messagebox.showinfo("Success", f"Residual Histogram saved to:\n{file_path}")
-                
-            except Exception as e:
-                messagebox.showerror("Save Error", f"Failed to save Residual Histogram: {str(e)}")
+        self._save_single_plot('histogram', default_filename, "Residual Histogram")
     
-    def save_all_individual_plots(self, fig, ax1, ax2, ax3, mineral, algorithm):
-        """Save all individual plots at once"""
-        from tkinter import filedialog, messagebox
-        import os
-        
+    def _save_plots_parallel(self, directory, kinds, base):
+        """
+        Save several individual plots as PNG files in directory, one worker
+        thread and Figure per plot. Returns the file names in kinds order.
+        """
+        # Workers share one snapshot even if the visible tab changes meanwhile
+        data = self.plot_data
+        filenames = [f"{base}_{kind}.png" for kind in kinds]
+        
+        with ThreadPoolExecutor(max_workers=min(3, len(kinds))) as executor:
+            futures = [executor.submit(self._save_plot, kind, os.path.join(directory, filename), data)
+                       for kind, filename in zip(kinds, filenames)]
+            for future in futures:
+                future.result()
+        
+        return filenames
+    
+    def save_all_individual_plots(self, base):
+        """Save all individual plots at once as base_<kind>.png"""
         if not hasattr(self, 'plot_data'):
             messagebox.showerror("Error", "No plot data available")
             return
@@ -534,60 +826,7 @@ class ResultsTab:
         
         if directory:
             try:
-                data = self.plot_data
-                saved_files = []
-                
-                # Save spectral fit plot
-                filename = f"{mineral}_{algorithm}_spectral_fit.png"
-                file_path = os.path.join(directory, filename)
-                fig1 = Figure(figsize=(10, 6), dpi=300)
-                ax1 = fig1.add_subplot(111)
-                ax1.plot(data['wavelength'], data['meanspec'], color='black', linewidth=2, label='Observed', alpha=0.8)
-                ax1.plot(data['wavelength'], data['bestfit'], 'r-', linewidth=2, label='Model Fit')
-                ax1.fill_between(data['wavelength'], data['meanspec'] - data['measurerr'], 
-                               data['meanspec'] + data['measurerr'], alpha=0.3, color='gray', label='Uncertainty')
-                ax1.set_xlabel('Wavelength (μm)', fontsize=12)
-                ax1.set_ylabel('Emissivity', fontsize=12)
-                ax1.set_title(f'Spectral Fit: {data["algorithm"]} Analysis of {data["mineral"]}', fontsize=14, fontweight='bold')
-                ax1.legend(fontsize=11)
-                ax1.grid(True, alpha=0.3)
-                fig1.tight_layout()
-                fig1.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                saved_files.append(filename)
-                
-                # Save residuals plot
-                filename = f"{mineral}_{algorithm}_residuals.png"
-                file_path = os.path.join(directory, filename)
-                fig2 = Figure(figsize=(8, 6), dpi=300)
-                ax2 = fig2.add_subplot(111)
-                ax2.plot(data['wavelength'], data['reserror'], 'b-', linewidth=1, alpha=0.7)
-                ax2.axhline(y=0, color='black', linestyle='--', alpha=0.5)
-                ax2.fill_between(data['wavelength'], -data['measurerr'], data['measurerr'], alpha=0.2, color='gray')
-                ax2.set_xlabel('Wavelength (μm)', fontsize=12)
-                ax2.set_ylabel('Residual', fontsize=12)
-                ax2.set_title('Fit Residuals', fontsize=14, fontweight='bold')
-                ax2.grid(True, alpha=0.3)
-                fig2.tight_layout()
-                fig2.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                saved_files.append(filename)
-                
-                # Save histogram plot
-                filename = f"{mineral}_{algorithm}_histogram.png"
-                file_path = os.path.join(directory, filename)
-                fig3 = Figure(figsize=(8, 6), dpi=300)
-                ax3 = fig3.add_subplot(111)
-                n, bins, patches = ax3.hist(data['reserror'], bins=20, alpha=0.7, color='blue', edgecolor='black')
-                ax3.axvline(x=0, color='black', linestyle='--', alpha=0.5)
-                ax3.axvline(x=np.mean(data['reserror']), color='r', linestyle='-', alpha=0.7, 
-                          label=f'Mean: {np.mean(data["reserror"]):.4f}')
-                ax3.set_xlabel('Residual Value', fontsize=12)
-                ax3.set_ylabel('Frequency', fontsize=12)
-                ax3.set_title('Residual Distribution', fontsize=14, fontweight='bold')
-                ax3.legend(fontsize=11)
-                ax3.grid(True, alpha=0.3)
-                fig3.tight_layout()
-                fig3.savefig(file_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
-                saved_files.append(filename)
+                saved_files = self._save_plots_parallel(directory, list(self._plot_builders), base)
                 
                 messagebox.showinfo("Success", 
                                   f"All plots saved successfully to:\n{directory}\n\n" +
@@ -611,6 +850,9 @@ class ResultsTab:
         
         tb.Button(button_frame, text="Copy Summary", 
                  bootstyle="secondary-outline", command=self.copy_summary).pack(side="left", padx=3)
+        
+        tb.Button(button_frame, text="Close Result", 
+                 bootstyle="danger-outline", command=self.close_result_tab).pack(side="right", padx=3)
     
     def export_to_excel(self):
         """Export comprehensive results to Excel file with all spectral data"""
@@ -636,85 +878,103 @@ class ResultsTab:
                     'Max_Wavelength_Filter': [results.get('maxwl', 'None')],
                     'Total_Selected_EndMembers': [len(results.get('all_selected_endmembers', []))],
                     'EndMembers_Used_in_Fit': [len(results['endmembers'])],
-                    'Analysis_Date': [pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')]
+                    'Analysis_Date': [datetime.now().strftime('%Y-%m-%d %H:%M:%S')]
                 }
                 
                 # Create comprehensive abundance data showing ALL selected end-members
                 all_selected = results.get('all_selected_endmembers', results['endmembers'])
-                fitted_endmembers = [str(em) for em in results['endmembers']]
+                all_arr = np.array([str(em) for em in all_selected])
                 
+                # Position of each selected end-member in the fit (first occurrence),
+                # or -1 when it was not used
+                fitted_idx = {}
+                for i, em in enumerate(results['endmembers']):
+                    fitted_idx.setdefault(str(em), i)
+                idx = np.fromiter((fitted_idx.get(em, -1) for em in all_arr), dtype=int, count=len(all_arr))
+                used = idx >= 0
+                
+                # Selected end-members not used in the fit keep zero abundance
+                abundance = np.zeros(len(all_arr))
+                error = np.zeros(len(all_arr))
+                abundance[used] = np.asarray(results['abundances'], dtype=float)[idx[used]]
+                error[used] = np.asarray(results['errors'], dtype=float)[idx[used]]
+                rel_error = np.divide(error * 100, abundance, out=np.zeros_like(error), where=abundance > 0)
+                
+                # Yes/No columns are categorical: small integer codes instead of
+                # one string object per cell
                 abundance_data = {
-                    'End_Member': [],
-                    'Selected_for_Analysis': [],
-                    'Used_in_Final_Fit': [],
-                    'Abundance': [],
-                    'Error': [],
-                    'Relative_Error_Percent': []
+                    'End_Member': all_arr,
+                    'Selected_for_Analysis': pd.Categorical.from_codes(
+                        np.zeros(len(all_arr), dtype=np.int8), categories=['Yes']),
+                    'Used_in_Final_Fit': pd.Categorical.from_codes(
+                        used.astype(np.int8), categories=['No (Zero Abundance)', 'Yes']),
+                    'Abundance': abundance,
+                    'Error': error,
+                    'Relative_Error_Percent': rel_error
                 }
                 
                 if results['normalized_abundances'] is not None:
-                    abundance_data['Normalized_Abundance'] = []
-                
-                # Add all selected end-members, even those not used
-                for em in all_selected:
-                    em_str = str(em)
-                    abundance_data['End_Member'].append(em_str)
-                    abundance_data['Selected_for_Analysis'].append('Yes')
-                    
-                    if em_str in fitted_endmembers:
-                        # This end-member was used in the fit
-                        idx = fitted_endmembers.index(em_str)
-                        abundance_data['Used_in_Final_Fit'].append('Yes')
-                        abundance_data['Abundance'].append(results['abundances'][idx])
-                        abundance_data['Error'].append(results['errors'][idx])
-                        rel_error = (results['errors'][idx] / results['abundances'][idx] * 100) if results['abundances'][idx] > 0 else 0
-                        abundance_data['Relative_Error_Percent'].append(rel_error)
-                        
-                        if results['normalized_abundances'] is not None:
-                            abundance_data['Normalized_Abundance'].append(results['normalized_abundances'][idx])
-                    else:
-                        # This end-member was selected but not used (zero abundance)
-                        abundance_data['Used_in_Final_Fit'].append('No (Zero Abundance)')
-                        abundance_data['Abundance'].append(0.0)
-                        abundance_data['Error'].append(0.0)
-                        abundance_data['Relative_Error_Percent'].append(0.0)
-                        
-                        if results['normalized_abundances'] is not None:
-                            abundance_data['Normalized_Abundance'].append(0.0)
+                    normalized = np.zeros(len(all_arr))
+                    normalized[used] = np.asarray(results['normalized_abundances'], dtype=float)[idx[used]]
+                    abundance_data['Normalized_Abundance'] = normalized
                 
-                # Create spectral data for the mixed sample
-                wavelength = 10000 / results['wavenumber']
+                # Create spectral data for the mixed sample; the wavelength grid was
+                # derived when the result was created and is shared with identical grids
+                wavelength = results['wavelength']
+                known_grids = [(results['wavenumber'], wavelength)]
                 mixed_spectral_data = {
-                    'Wavenumber': results['wavenumber'].tolist(),
-                    'Wavelength': wavelength.tolist(),
-                    'Observed_Emissivity': results['meanspec'].tolist(),
-                    'Model_Fit': results['bestfit'].tolist(),
-                    'Residual': results['reserror'].tolist(),
-                    'Uncertainty': results['measurerr'].tolist()
+                    'Wavenumber': results['wavenumber'],
+                    'Wavelength': wavelength,
+                    'Observed_Emissivity': results['meanspec'],
+                    'Model_Fit': results['bestfit'],
+                    'Residual': results['reserror'],
+                    'Uncertainty': results['measurerr']
                 }
                 
                 # Save to Excel or CSV
                 if file_path.endswith('.xlsx'):
-                    with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                        # Main results sheets
-                        pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-                        pd.DataFrame(abundance_data).to_excel(writer, sheet_name='Abundances', index=False)
-                        pd.DataFrame(mixed_spectral_data).to_excel(writer, sheet_name='Mixed_Spectrum', index=False)
-                        
-                        # Add individual end-member spectra if available
-                        if results.get('mixed_spectrum_data') is not None:
-                            # Original mixed spectrum (before any filtering)
-                            mixed_original = results['mixed_spectrum_data'].copy()
-                            mixed_original['Wavelength'] = 10000 / mixed_original['Wavenumber']
-                            mixed_original = mixed_original[['Wavenumber', 'Wavelength', 'Emissivity', 'Uncertainty']]
-                            mixed_original.to_excel(writer, sheet_name='Mixed_Original_Full', index=False)
-                        
-                        # Add individual end-member spectra
-                        self._export_endmember_spectra(writer, results)
+                    # Original mixed spectrum (before any filtering); when no filter
+                    # removed any points it repeats Mixed_Spectrum, so it is skipped
+                    original_sheet = None
+                    mixed_original = results.get('mixed_spectrum_data')
+                    if mixed_original is not None:
+                        wavenumber = mixed_original['Wavenumber'].to_numpy()
+                        emissivity = mixed_original['Emissivity'].to_numpy()
+                        if (np.array_equal(wavenumber, results['wavenumber']) and
+                                np.array_equal(emissivity, results['meanspec'])):
+                            summary_data['Original_Spectrum'] = ['Same as Mixed_Spectrum']
+                        else:
+                            original_sheet = pd.DataFrame({
+                                'Wavenumber': wavenumber,
+                                'Wavelength': self._wavelength_for(wavenumber, known_grids),
+                                'Emissivity': emissivity,
+                                'Uncertainty': mixed_original['Uncertainty'].to_numpy()
+                            })
+                    
+                    # Main results sheets
+                    sheets = [
+                        ('Summary', pd.DataFrame(summary_data).astype(SUMMARY_DTYPES)),
+                        ('Abundances', pd.DataFrame(abundance_data)),
+                        ('Mixed_Spectrum', pd.DataFrame(mixed_spectral_data))
+                    ]
+                    
+                    if original_sheet is not None:
+                        sheets.append(('Mixed_Original_Full', original_sheet))
+                    
+                    # Add individual end-member spectra
+                    sheets.extend(self._endmember_spectra_sheets(results, known_grids))
+                    
+                    # Rows are streamed to disk one at a time
+                    ExcelExporter.write_sheets(file_path, sheets)
                         
                 else:
-                    # For CSV, save abundance data only
-                    pd.DataFrame(abundance_data).to_csv(file_path, index=False)
+                    # For CSV, save abundance data only. The columns mix names and
+                    # numbers, so they are zipped into rows for the stdlib writer
+                    # without building a DataFrame
+                    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                        writer = csv.writer(f, lineterminator='\n')
+                        writer.writerow(abundance_data.keys())
+                        writer.writerows(zip(*abundance_data.values()))
                 
                 messagebox.showinfo("Success", f"Comprehensive results exported to:\n{file_path}")
                 
@@ -723,37 +983,74 @@ class ResultsTab:
                 import traceback
                 traceback.print_exc()
     
-    def _export_endmember_spectra(self, writer, results):
-        """Export individual end-member spectra to separate Excel sheets"""
+    @staticmethod
+    def _wavelength_for(wavenumber, known_grids):
+        """
+        Return 10000 / wavenumber, reusing the wavelength of an identical grid
+        from known_grids, a list of (wavenumber, wavelength) pairs that new
+        grids are added to.
+        """
+        for grid, wavelength in known_grids:
+            if grid is wavenumber or (grid.shape == wavenumber.shape and np.array_equal(grid, wavenumber)):
+                return wavelength
+        
+        wavelength = 10000 / wavenumber
+        known_grids.append((wavenumber, wavelength))
+        return wavelength
+    
+    def _load_endmember_spectrum(self, em_file):
+        """Load an end-member spectrum, through the data manager if available"""
+        if self.data_manager:
+            return self.data_manager.load_spectrum(em_file)
+        # Fallback: load directly
+        return pd.read_csv(em_file, sep='\t')
+    
+    def _endmember_spectra_sheets(self, results, known_grids=None):
+        """
+        Return (sheet name, DataFrame) pairs for the individual end-member spectra.
+        Files are read concurrently; end-members sharing a wavenumber grid share
+        one wavelength array.
+        """
+        if known_grids is None:
+            known_grids = []
+        sheets = []
         try:
             all_selected = results.get('all_selected_endmembers', [])
             
-            for i, em_name in enumerate(all_selected):
-                try:
-                    # Load the original end-member spectrum from file
-                    em_file = os.path.join("spectral/spectral_library", f"{em_name}.txt")
-                    if os.path.exists(em_file):
-                        # Use the data manager if available
-                        if self.data_manager:
-                            em_df = self.data_manager.load_spectrum(em_file)
-                        else:
-                            # Fallback: load directly
-                            em_df = pd.read_csv(em_file, sep='\t')
+            # Load the original end-member spectra from file in the background;
+            # sheets are still assembled one at a time in selection order
+            em_files = {em_name: os.path.join("spectral/spectral_library", f"{em_name}.txt")
+                        for em_name in all_selected}
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {em_name: executor.submit(self._load_endmember_spectrum, em_file)
+                           for em_name, em_file in em_files.items() if os.path.exists(em_file)}
+                
+                for em_name in all_selected:
+                    if em_name not in futures:
+                        continue
+                    try:
+                        em_df = futures[em_name].result()
                         
                         # Add wavelength column
-                        em_df['Wavelength'] = 10000 / em_df['Wavenumber']
-                        em_df = em_df[['Wavenumber', 'Wavelength', 'Emissivity', 'Uncertainty']]
+                        wavenumber = em_df['Wavenumber'].to_numpy()
+                        em_sheet = pd.DataFrame({
+                            'Wavenumber': wavenumber,
+                            'Wavelength': self._wavelength_for(wavenumber, known_grids),
+                            'Emissivity': em_df['Emissivity'].to_numpy(),
+                            'Uncertainty': em_df['Uncertainty'].to_numpy()
+                        })
                         
                         # Create safe sheet name (Excel has 31 char limit)
-                        sheet_name = f"EM_{em_name}"[:31]
-                        em_df.to_excel(writer, sheet_name=sheet_name, index=False)
+                        sheets.append((f"EM_{em_name}"[:31], em_sheet))
                         
-                except Exception as e:
-                    print(f"Warning: Could not export end-member {em_name}: {e}")
-                    continue
+                    except Exception as e:
+                        print(f"Warning: Could not export end-member {em_name}: {e}")
+                        continue
                     
         except Exception as e:
             print(f"Warning: Could not export end-member spectra: {e}")
+        
+        return sheets
     
     def export_plots_pdf(self):
         """Export plots as PDF"""
@@ -774,22 +1071,28 @@ class ResultsTab:
 
 Algorithm: {results['algorithm']}
 Sample: {results['mineral']}
-Analysis Date: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}
+Analysis Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 RMS Error: {results['RMS']:.6f}
 
 Abundance Results:
 """
             
-            for i, (em, abundance, error) in enumerate(zip(results['endmembers'], 
-                                                          results['abundances'], 
-                                                          results['errors'])):
-                rel_error = (error / abundance * 100) if abundance > 0 else 0
-                summary_text += f"  {em}: {abundance:.4f} ± {error:.4f} ({rel_error:.1f}%)\n"
+            # Relative errors for all end-members at once
+            abundances = np.asarray(results['abundances'], dtype=float)
+            errors = np.asarray(results['errors'], dtype=float)
+            rel_errors = np.divide(errors * 100, abundances, out=np.zeros_like(errors), where=abundances > 0)
+            
+            # Collect the lines and join once instead of growing the string;
+            # the %-templates are bound once and applied to each row tuple
+            line_fmt = "  %s: %.4f ± %.4f (%.1f%%)".__mod__
+            lines = list(map(line_fmt, zip(results['endmembers'], abundances, errors, rel_errors)))
             
             if results['normalized_abundances'] is not None:
-                summary_text += "\nNormalized Abundances:\n"
-                for em, norm_ab in zip(results['endmembers'], results['normalized_abundances']):
-                    summary_text += f"  {em}: {norm_ab:.4f}\n"
+                norm_fmt = "  %s: %.4f".__mod__
+                lines.append("\nNormalized Abundances:")
+                lines.extend(map(norm_fmt, zip(results['endmembers'], results['normalized_abundances'])))
+            
+            summary_text += "\n".join(lines) + "\n"
             
             # Copy to clipboard
             self.frame.clipboard_clear()
@@ -801,7 +1104,20 @@ Abundance Results:
     
     def create_plot(self, parent, mineral, algorithm, wavenumber, meanspec, 
                    bestfit, reserror, measurerr, RMS):
-        """Create the spectral fit plot"""
+        """Create the spectral fit plot, or update the one already shown in parent"""
+        # Convert wavenumber to wavelength
+        X_wavenumber = wavenumber
+        X_wavelength = 10000 / X_wavenumber
+        Y = bestfit
+        RMS_str = "{:.4E}".format(RMS)
+        
+        # Reuse the figure already shown in this parent; only the data changes
+        plot_state = self._plot_cache.get(str(parent))
+        if plot_state is not None and plot_state['canvas'].get_tk_widget().winfo_exists():
+            self._update_plot(plot_state, mineral, algorithm, X_wavelength, meanspec, 
+                              Y, reserror, measurerr, RMS_str)
+            return
+        
         # Create figure for plotting
         fig = Figure(figsize=(6, 6))
         
@@ -809,27 +1125,21 @@ Abundance Results:
         ax = fig.add_subplot(211)
         ax2 = fig.add_subplot(212, sharex=ax)
         
-        # Convert wavenumber to wavelength
-        X_wavenumber = wavenumber
-        X_wavelength = 10000 / X_wavenumber
-        Y = bestfit
-        RMS_str = "{:.4E}".format(RMS)
-
         # Plot data
-        ax.plot(X_wavelength, meanspec, label=mineral, linewidth=2)
-        ax.plot(X_wavelength, Y, 'r--', label=algorithm)
-        ax.errorbar(X_wavelength, meanspec, yerr=measurerr, lw=1, c='c', alpha=0.5)
+        obs_line, = ax.plot(X_wavelength, meanspec, label=mineral, linewidth=2)
+        fit_line, = ax.plot(X_wavelength, Y, 'r--', label=algorithm)
+        err_container = ax.errorbar(X_wavelength, meanspec, yerr=measurerr, lw=1, c='c', alpha=0.5)
         ax.set_ylabel('Effective Emissivity', fontsize=12)
         ax.legend()
         # Normal x-axis direction
         ax.tick_params(labelbottom=False)
 
-        ax2.plot(X_wavelength, reserror, c='k')
+        res_line, = ax2.plot(X_wavelength, reserror, c='k')
         ax2.axhline(y=0, linestyle='--', color='k', alpha=0.4)
         ax2.set_xlabel('Wavelength ($\mu$ m)', fontsize=12)
         ax2.set_ylabel('Residual Error', fontsize=12)
         ax2.invert_xaxis()
-        ax2.text(0.05, 0.9, f'RMS error: {RMS_str}', transform=ax2.transAxes)
+        rms_text = ax2.text(0.05, 0.9, f'RMS error: {RMS_str}', transform=ax2.transAxes)
 
         # Wavenumber twin axis
         ax3 = ax.twiny()
@@ -862,6 +1172,20 @@ Abundance Results:
         self.current_mineral = mineral
         self.current_algorithm = algorithm
         
+        # Keep the artists so a new result for this parent only swaps data
+        plot_state = {
+            'canvas': canvas,
+            'axes': (ax, ax2),
+            'obs_line': obs_line,
+            'fit_line': fit_line,
+            'err_container': err_container,
+            'res_line': res_line,
+            'rms_text': rms_text,
+            'mineral': mineral,
+            'algorithm': algorithm
+        }
+        self._plot_cache[str(parent)] = plot_state
+        
         # Create and configure the navigation toolbar
         toolbar = NavigationToolbar2Tk(canvas, toolbar_frame)
         toolbar.update()
@@ -873,15 +1197,13 @@ Abundance Results:
             ax3.set_xlim(new_xlim)
             
             # Create updated wavelength ticks within current view
-            visible_wavelength = np.linspace(new_xlim[0], new_xlim[1], num=5)
+            visible_wavelength = new_xlim[0] + (new_xlim[1] - new_xlim[0]) * TICK_FRACTIONS
             visible_wavenumber = 10000 / visible_wavelength
             
-            # Update the wavenumber axis ticks
+            # Update the wavenumber axis ticks; the pan/zoom that changed the
+            # limits already schedules the redraw
             ax3.set_xticks(visible_wavelength)
             ax3.set_xticklabels([f"{wn:.0f}" for wn in visible_wavenumber])
-            
-            # Redraw canvas
-            canvas.draw_idle()
         
         # Connect the event handler for axis limits changing
         ax.callbacks.connect('xlim_changed', on_xlim_changed)
@@ -900,7 +1222,7 @@ Abundance Results:
                     ("SVG Image", "*.svg"),
                     ("JPEG Image", "*.jpg")
                 ],
-                initialfile=f"{mineral}_{algorithm}_plot"
+                initialfile=f"{plot_state['mineral']}_{plot_state['algorithm']}_plot"
             )
             
             if file_path:
@@ -926,6 +1248,42 @@ Abundance Results:
                             bootstyle="secondary")
         help_label.pack(pady=2)
     
+    def _update_plot(self, plot_state, mineral, algorithm, X_wavelength, meanspec, 
+                     Y, reserror, measurerr, RMS_str):
+        """Show a new result in a figure made by create_plot without rebuilding it"""
+        ax, ax2 = plot_state['axes']
+        
+        plot_state['obs_line'].set_data(X_wavelength, meanspec)
+        plot_state['obs_line'].set_label(mineral)
+        plot_state['fit_line'].set_data(X_wavelength, Y)
+        plot_state['fit_line'].set_label(algorithm)
+        plot_state['res_line'].set_data(X_wavelength, reserror)
+        plot_state['rms_text'].set_text(f'RMS error: {RMS_str}')
+        
+        # Error bars: the marker line plus one vertical segment per point
+        data_line, _, (bar_segments,) = plot_state['err_container']
+        data_line.set_data(X_wavelength, meanspec)
+        bar_segments.set_segments(np.stack((np.column_stack((X_wavelength, meanspec - measurerr)),
+                                            np.column_stack((X_wavelength, meanspec + measurerr))), axis=1))
+        ax.legend()
+        
+        # Rescaling fires xlim_changed, which also relabels the wavenumber axis;
+        # the error bars are a collection, so their extent is added by hand
+        for axis in (ax, ax2):
+            axis.relim()
+        ax.update_datalim(np.column_stack((X_wavelength, meanspec - measurerr)))
+        ax.update_datalim(np.column_stack((X_wavelength, meanspec + measurerr)))
+        for axis in (ax, ax2):
+            axis.autoscale_view()
+        
+        plot_state['mineral'] = mineral
+        plot_state['algorithm'] = algorithm
+        self.current_fig = plot_state['canvas'].figure
+        self.current_mineral = mineral
+        self.current_algorithm = algorithm
+        
+        plot_state['canvas'].draw_idle()
+    
     def create_wls_table(self, parent, endmembers, abundances, errors):
         """Create a table for WLS results"""
         # Create Treeview for table
@@ -952,18 +1310,22 @@ Abundance Results:
         y_scrollbar = tb.Scrollbar(parent, orient="vertical", command=self.results_tv.yview)
         self.results_tv.configure(yscrollcommand=y_scrollbar.set)
         
-        # Grid layout
-        self.results_tv.pack(fill="both", expand=True, side="left")
-        y_scrollbar.pack(fill="y", side="right")
-        
-        # Add data rows
-        for i, (em, abund, err) in enumerate(zip(endmembers, abundances, errors)):
-            self.results_tv.insert("", "end", values=(em, f"{abund:.4f}", f"{err:.4f}"))
+        # Add data rows, formatted up front, before the table is mapped
+        abundances = np.asarray(abundances, dtype=float)
+        rows = zip(endmembers, np.char.mod('%.4f', abundances),
+                   np.char.mod('%.4f', np.asarray(errors, dtype=float)))
+        insert = self.results_tv.insert
+        for row in rows:
+            insert("", "end", values=row)
             
         # Add total row if more than one end member
         if len(endmembers) > 1:
-            self.results_tv.insert("", "end", values=("", "", ""))
-            self.results_tv.insert("", "end", values=("TOTAL", f"{np.sum(abundances):.4f}", ""))
+            insert("", "end", values=("", "", ""))
+            insert("", "end", values=("TOTAL", f"{abundances.sum():.4f}", ""))
+        
+        # Grid layout
+        self.results_tv.pack(fill="both", expand=True, side="left")
+        y_scrollbar.pack(fill="y", side="right")
     
     def create_sto_table(self, parent, endmembers, abundances, norm_abundances, errors):    
         """Create a table for STO results"""
@@ -992,27 +1354,27 @@ Abundance Results:
         y_scrollbar = tb.Scrollbar(parent, orient="vertical", command=self.results_tv.yview)
         self.results_tv.configure(yscrollcommand=y_scrollbar.set)
         
+        # Add data rows, formatted up front, before the table is mapped
+        abundances = np.asarray(abundances, dtype=float)
+        rows = zip(endmembers, np.char.mod('%.4f', abundances),
+                   np.char.mod('%.4f', np.asarray(norm_abundances, dtype=float)),
+                   np.char.mod('%.4f', np.asarray(errors, dtype=float)))
+        insert = self.results_tv.insert
+        for row in rows:
+            insert("", "end", values=row)
+            
+        # Add total row
+        insert("", "end", values=("", "", "", ""))
+        insert("", "end", values=("TOTAL", f"{abundances.sum():.4f}", "1.0000", ""))
+        
         # Grid layout
         self.results_tv.pack(fill="both", expand=True, side="left")
         y_scrollbar.pack(fill="y", side="right")
-        
-        # Add data rows
-        for i, (em, abund, norm, err) in enumerate(zip(endmembers, abundances, 
-                                                       norm_abundances, errors)):
-            self.results_tv.insert("", "end", 
-                                 values=(em, f"{abund:.4f}", f"{norm:.4f}", f"{err:.4f}"))
-            
-        # Add total row
-        self.results_tv.insert("", "end", values=("", "", "", ""))
-        self.results_tv.insert("", "end", 
-                             values=("TOTAL", f"{np.sum(abundances):.4f}", "1.0000", ""))
     
     def export_results(self):
         """Export results from currently selected tab"""
         # Check if we have results
-        if len(self.results_notebook.tabs()) == 0 or \
-           (len(self.results_notebook.tabs()) == 1 and 
-            self.results_notebook.tab(0, "text") == "No Results"):
+        if not self._tabs:
             messagebox.showwarning("Export", "No results available to export")
             return
             
@@ -2,12 +2,18 @@
 Settings tab for the Mineral Spectra Analyzer
 """
 
+import configparser
+import os
 import tkinter as tk
 from tkinter import messagebox, filedialog
 import ttkbootstrap as tb
 from ttkbootstrap.scrolled import ScrolledFrame
 
 
+# Settings file in the user's home directory
+CONFIG_PATH = os.path.join(os.path.expanduser("~"), ".mineral_spectra.ini")
+
+
 class SettingsTab:
     """Settings tab implementation"""
     
@@ -15,13 +21,23 @@ class SettingsTab:
         self.parent = parent
         self.update_status = status_callback
         self.data_manager = data_manager
+        self._config_path = CONFIG_PATH
+        
+        # Settings as last written to (or read from) the config file
+        self._last_saved = None
         
         # Create main frame
         self.frame = tb.Frame(parent)
         self.setup_ui()
+        
+        # Saved settings override the defaults the widgets start with
+        self.load_settings()
     
     def setup_ui(self):
         """Setup the settings tab UI"""
+        # One Style handle for the theme list, the current theme and switching
+        self._style = tb.Style()
+        
         # Create scrolled frame for settings
         settings_frame = ScrolledFrame(self.frame, autohide=True)
         settings_frame.pack(fill="both", expand=True, padx=10, pady=10)
@@ -38,8 +54,8 @@ class SettingsTab:
         
         tb.Label(theme_frame, text="Theme:").pack(side="left", padx=5)
         
-        self.theme_var = tk.StringVar(value=tb.Style().theme.name)
-        theme_combobox = tb.Combobox(theme_frame, values=sorted(tb.Style().theme_names()), 
+        self.theme_var = tk.StringVar(value=self._style.theme.name)
+        theme_combobox = tb.Combobox(theme_frame, values=sorted(self._style.theme_names()), 
                                     textvariable=self.theme_var)
         theme_combobox.pack(side="left", padx=5)
         theme_combobox.bind("<<ComboboxSelected>>", 
@@ -58,19 +74,21 @@ class SettingsTab:
             ("Spectral Library", "spectral/spectral_library")
         ]
         
-        for label, path in folders:
-            folder_frame = tb.Frame(folder_section)
-            folder_frame.pack(fill="x", pady=5)
-            
-            tb.Label(folder_frame, text=f"{label}:").pack(side="left", padx=5)
+        # One grid for all folder rows; the entry column takes the extra width
+        folder_grid = tb.Frame(folder_section)
+        folder_grid.pack(fill="x")
+        folder_grid.columnconfigure(1, weight=1)
+        
+        for row, (label, path) in enumerate(folders):
+            tb.Label(folder_grid, text=f"{label}:").grid(row=row, column=0, sticky="w", padx=5, pady=5)
             
             path_var = tk.StringVar(value=path)
             self.folder_vars[label] = path_var
-            path_entry = tb.Entry(folder_frame, textvariable=path_var, width=40)
-            path_entry.pack(side="left", padx=5, fill="x", expand=True)
+            path_entry = tb.Entry(folder_grid, textvariable=path_var, width=40)
+            path_entry.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
             
-            tb.Button(folder_frame, text="Browse", 
-                     command=lambda pv=path_var: self.select_folder(pv)).pack(side="left", padx=5)
+            tb.Button(folder_grid, text="Browse", 
+                     command=lambda pv=path_var: self.select_folder(pv)).grid(row=row, column=2, padx=5, pady=5)
         
         # Analysis settings
         analysis_section = tb.Labelframe(inner_frame, text="Analysis Settings", padding=15)
@@ -140,28 +158,88 @@ class SettingsTab:
     
     def change_theme(self, theme_name):
         """Change application theme"""
-        tb.Style(theme=theme_name)
+        # Re-selecting the active theme would regenerate every ttk style for nothing
+        if theme_name == self._style.theme.name:
+            return
+        self._style.theme_use(theme_name)
         self.update_status(f"Theme changed to {theme_name}")
     
+    def load_settings(self):
+        """Load saved settings from the config file, if there is one"""
+        config = configparser.ConfigParser(interpolation=None)
+        try:
+            if not config.read(self._config_path, encoding="utf-8"):
+                return
+            
+            for label, path_var in self.folder_vars.items():
+                path_var.set(config.get("folders", label, fallback=path_var.get()))
+            
+            self.default_alg_var.set(config.get("analysis", "algorithm", 
+                                                fallback=self.default_alg_var.get()))
+            self.export_format_var.set(config.get("export", "format", 
+                                                  fallback=self.export_format_var.get()))
+            self.include_spectra_var.set(config.getboolean("export", "include_spectra", 
+                                                           fallback=self.include_spectra_var.get()))
+            self.plot_dpi_var.set(config.getint("plot", "dpi", fallback=self.plot_dpi_var.get()))
+            
+            # Only switch to themes ttkbootstrap knows about
+            theme_name = config.get("ui", "theme", fallback=None)
+            if theme_name in self._style.theme_names() and theme_name != self._style.theme.name:
+                self.theme_var.set(theme_name)
+                self._style.theme_use(theme_name)
+            
+            self._last_saved = self._current_settings()
+        except (configparser.Error, ValueError, tk.TclError) as e:
+            print(f"Warning: Could not load settings from {self._config_path}: {e}")
+    
+    def _current_settings(self):
+        """Collect the widget values as config sections of strings"""
+        return {
+            "folders": {label: path_var.get() for label, path_var in self.folder_vars.items()},
+            "analysis": {"algorithm": self.default_alg_var.get()},
+            "export": {
+                "format": self.export_format_var.get(),
+                "include_spectra": str(self.include_spectra_var.get())
+            },
+            "plot": {"dpi": str(self.plot_dpi_var.get())},
+            "ui": {"theme": self.theme_var.get()}
+        }
+    
     def save_settings(self):
         """Save application settings"""
-        # In a real application, this would save to a configuration file
-        # For now, we'll just show a success message
-        
-        # Validate settings
-        valid = True
-        for label, path_var in self.folder_vars.items():
-            if not path_var.get():
-                messagebox.showwarning("Invalid Settings", 
-                                     f"{label} path cannot be empty")
-                valid = False
-                break
-        
-        if valid:
-            # Here you would typically save to a config file
-            # For example, using configparser or json
-            messagebox.showinfo("Settings", "Settings saved successfully")
-            self.update_status("Settings saved")
+        try:
+            current = self._current_settings()
+        except tk.TclError:
+            messagebox.showwarning("Invalid Settings", "Plot DPI must be a whole number")
+            return
+        
+        # Nothing to validate or write if the settings match the saved file
+        if current == self._last_saved:
+            self.update_status("No settings changed")
+            return
+        
+        # Validate all folders in one pass so every problem is reported at once
+        invalid = [label for label, path in current["folders"].items() 
+                   if not path or not os.path.isdir(path)]
+        if invalid:
+            messagebox.showwarning("Invalid Settings", 
+                                 "These folders are empty or do not exist:\n" + 
+                                 "\n".join(f"{label}: {current['folders'][label] or '(empty)'}" 
+                                           for label in invalid))
+            return
+        
+        config = configparser.ConfigParser(interpolation=None)
+        config.read_dict(current)
+        try:
+            with open(self._config_path, "w", encoding="utf-8") as f:
+                config.write(f)
+        except OSError as e:
+            messagebox.showerror("Settings", f"Failed to save settings: {str(e)}")
+            return
+        
+        self._last_saved = current
+        messagebox.showinfo("Settings", "Settings saved successfully")
+        self.update_status("Settings saved")
     
     def reset_defaults(self):
         """Reset all settings to default values"""
@@ -11,19 +11,48 @@ from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 
 
+# Light and dark ttkbootstrap themes, used to pick plot colors
+LIGHT_THEMES = frozenset({
+    'cosmo', 'flatly', 'journal', 'litera', 'lumen', 'minty', 
+    'pulse', 'sandstone', 'united', 'yeti', 'morph', 'simplex',
+    'cerulean', 'spacelab', 'default'
+})
+
+DARK_THEMES = frozenset({
+    'cyborg', 'darkly', 'slate', 'solar', 'superhero', 'vapor',
+    'quartz', 'theme'
+})
+
+# Relative positions of the five wavenumber-axis ticks within the view
+TICK_FRACTIONS = np.linspace(0.0, 1.0, num=5)
+
+
 class SpectrumViewer:
     """Window for viewing individual spectrum"""
     
+    # Plot colors per theme name, shared by all viewers
+    _THEME_COLOR_CACHE = {}
+    
     def __init__(self, parent, spectrum_name, spectrum_df):
         self.parent = parent
         self.spectrum_name = spectrum_name
         self.spectrum_df = spectrum_df
         
+        # Extract the columns once; the plot, statistics and export share them
+        self._wn = spectrum_df['Wavenumber'].to_numpy(dtype=np.float64, copy=False)
+        self._emis = spectrum_df['Emissivity'].to_numpy(dtype=np.float64, copy=False)
+        self._unc = spectrum_df['Uncertainty'].to_numpy(dtype=np.float64, copy=False)
+        self._wl = 10000.0 / self._wn
+        self._wl_min, self._wl_max = self._wl.min(), self._wl.max()
+        
         # Create window
         self.window = tb.Toplevel(parent)
         self.window.title(f"Spectrum: {spectrum_name}")
         self.window.geometry("900x700")
         
+        # Pending wavenumber-axis relabel, coalesced across pan/zoom events
+        self._xlim_after_id = None
+        
         self.setup_ui()
     
     def get_theme_colors(self):
@@ -31,31 +60,26 @@ class SpectrumViewer:
         try:
             current_theme = tb.Style().theme.name.lower()
             
-            # Define light and dark themes
-            light_themes = {
-                'cosmo', 'flatly', 'journal', 'litera', 'lumen', 'minty', 
-                'pulse', 'sandstone', 'united', 'yeti', 'morph', 'simplex',
-                'cerulean', 'spacelab', 'default'
-            }
-            
-            dark_themes = {
-                'cyborg', 'darkly', 'slate', 'solar', 'superhero', 'vapor',
-                'quartz', 'theme'
-            }
+            cached = self._THEME_COLOR_CACHE.get(current_theme)
+            if cached is not None:
+                return cached
             
             # Determine if current theme is dark or light
-            if current_theme in dark_themes:
-                return {
+            if current_theme in DARK_THEMES:
+                colors = {
                     'text': 'white',
                     'grid': 'lightgray',
                     'line': 'white'
                 }
             else:  # Default to light theme colors
-                return {
+                colors = {
                     'text': 'black',
                     'grid': 'gray',
                     'line': 'black'
                 }
+            
+            self._THEME_COLOR_CACHE[current_theme] = colors
+            return colors
         except:
             # Fallback to light theme colors if detection fails
             return {
@@ -66,9 +90,35 @@ class SpectrumViewer:
     
     def setup_ui(self):
         """Setup the viewer UI"""
-        # Create toolbar frame
-        toolbar_frame = tb.Frame(self.window)
-        toolbar_frame.pack(side="top", fill="x", padx=5, pady=5)
+        self._build_plot()
+        
+        # The toolbar and statistics panel are built once the window is shown
+        self._chrome_built = False
+        self._map_binding = self.window.bind('<Map>', self._on_first_map, add='+')
+        self.window.bind('<Destroy>', self._on_destroy, add='+')
+    
+    def _on_first_map(self, event=None):
+        """Build the window chrome the first time the window is mapped"""
+        if self._chrome_built:
+            return
+        self._chrome_built = True
+        self.window.unbind('<Map>', self._map_binding)
+        self._build_chrome()
+    
+    def _on_destroy(self, event):
+        """Cancel a pending tick relabel when the window closes"""
+        # Children's <Destroy> events also reach the toplevel binding
+        if event.widget is not self.window:
+            return
+        if self._xlim_after_id is not None:
+            self.window.after_cancel(self._xlim_after_id)
+            self._xlim_after_id = None
+    
+    def _build_plot(self):
+        """Create the figure and its canvas"""
+        # Create toolbar frame; it is filled in by _build_chrome
+        self._toolbar_frame = tb.Frame(self.window)
+        self._toolbar_frame.pack(side="top", fill="x", padx=5, pady=5)
         
         # Create figure for plotting with transparent background
         self.fig = Figure(figsize=(10, 6), facecolor='none', edgecolor='none')
@@ -78,15 +128,10 @@ class SpectrumViewer:
         # Get theme colors
         theme_colors = self.get_theme_colors()
         
-        # Extract data
-        wavenumber = self.spectrum_df['Wavenumber'].values
-        wavelength = 10000 / wavenumber
-        emissivity = self.spectrum_df['Emissivity'].values
-        uncertainty = self.spectrum_df['Uncertainty'].values
-        
-        # Plot data
-        self.ax.plot(wavelength, emissivity, linewidth=2, label=self.spectrum_name)
-        self.ax.errorbar(wavelength, emissivity, yerr=uncertainty, alpha=0.3)
+        # Plot data; the uncertainty is one band polygon instead of a bar per point
+        self.ax.plot(self._wl, self._emis, linewidth=2, label=self.spectrum_name)
+        self.ax.fill_between(self._wl, self._emis - self._unc, self._emis + self._unc, 
+                             alpha=0.2, linewidth=0, label='±1σ')
         
         # Apply theme-aware styling
         self.ax.set_xlabel('Wavelength (μm)', fontsize=12, color=theme_colors['text'])
@@ -102,27 +147,29 @@ class SpectrumViewer:
         self.ax2.set_xlabel('Wavenumber (cm$^{-1}$)', fontsize=12, color=theme_colors['text'])
         self.ax2.tick_params(colors=theme_colors['text'])
         
-        wavelength_ticks = np.linspace(min(wavelength), max(wavelength), num=5)
+        wavelength_ticks = self._wl_min + (self._wl_max - self._wl_min) * TICK_FRACTIONS
         wavenumber_ticks = 10000 / wavelength_ticks
         self.ax2.set_xticks(wavelength_ticks)
-        self.ax2.set_xticklabels([f"{wn:.0f}" for wn in wavenumber_ticks])
+        self.ax2.set_xticklabels(np.char.mod('%.0f', wavenumber_ticks).tolist())
         
         # Normal x-axis direction (wavelength increases left to right)
         
-        # Create canvas for plotting
+        # Create canvas for plotting; it is rendered when Tk is next idle
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.window)
-        self.canvas.draw()
+        self.canvas.draw_idle()
         self.canvas.get_tk_widget().pack(fill="both", expand=True, padx=5, pady=5)
         
+        # Bind events for interactive updates
+        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+    
+    def _build_chrome(self):
+        """Create the toolbar, custom buttons and statistics panel"""
         # Add matplotlib toolbar
-        self.toolbar = NavigationToolbar2Tk(self.canvas, toolbar_frame)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, self._toolbar_frame)
         self.toolbar.update()
         
         # Add custom buttons
-        self.add_custom_buttons(toolbar_frame)
-        
-        # Bind events for interactive updates
-        self.ax.callbacks.connect('xlim_changed', self.on_xlim_changed)
+        self.add_custom_buttons(self._toolbar_frame)
         
         # Add statistics panel
         self.add_statistics_panel()
@@ -153,60 +200,59 @@ class SpectrumViewer:
         stats_frame.pack(side="bottom", fill="x", padx=5, pady=5)
         
         # Calculate statistics
-        emissivity = self.spectrum_df['Emissivity'].values
-        uncertainty = self.spectrum_df['Uncertainty'].values
-        wavelength = 10000 / self.spectrum_df['Wavenumber'].values
+        emissivity = self._emis
         
         stats = {
             "Data points": len(emissivity),
-            "Wavelength range": f"{wavelength.min():.2f} - {wavelength.max():.2f} μm",
+            "Wavelength range": f"{self._wl_min:.2f} - {self._wl_max:.2f} μm",
             "Emissivity range": f"{emissivity.min():.4f} - {emissivity.max():.4f}",
             "Mean emissivity": f"{emissivity.mean():.4f}",
             "Std deviation": f"{emissivity.std():.4f}",
-            "Mean uncertainty": f"{uncertainty.mean():.4f}"
+            "Mean uncertainty": f"{self._unc.mean():.4f}"
         }
         
-        # Display statistics in two columns
-        stats_text = tb.Frame(stats_frame)
-        stats_text.pack(fill="x")
+        # Display statistics in two columns of label/value pairs on one grid
+        stats_grid = tb.Frame(stats_frame)
+        stats_grid.pack(fill="x")
+        stats_grid.columnconfigure((1, 3), weight=1)
         
         items = list(stats.items())
         mid = len(items) // 2
         
-        # Left column
-        left_frame = tb.Frame(stats_text)
-        left_frame.pack(side="left", fill="x", expand=True)
-        
-        for label, value in items[:mid]:
-            row = tb.Frame(left_frame)
-            row.pack(fill="x", pady=2)
-            tb.Label(row, text=f"{label}:", width=15, anchor="w").pack(side="left")
-            tb.Label(row, text=value, bootstyle="info").pack(side="left")
-        
-        # Right column
-        right_frame = tb.Frame(stats_text)
-        right_frame.pack(side="left", fill="x", expand=True)
-        
-        for label, value in items[mid:]:
-            row = tb.Frame(right_frame)
-            row.pack(fill="x", pady=2)
-            tb.Label(row, text=f"{label}:", width=15, anchor="w").pack(side="left")
-            tb.Label(row, text=value, bootstyle="info").pack(side="left")
+        for i, (label, value) in enumerate(items):
+            row, column = (i, 0) if i < mid else (i - mid, 2)
+            tb.Label(stats_grid, text=f"{label}:", width=15, anchor="w").grid(
+                row=row, column=column, sticky="w", pady=2)
+            tb.Label(stats_grid, text=value, bootstyle="info").grid(
+                row=row, column=column + 1, sticky="w", pady=2)
     
     def on_xlim_changed(self, event):
         """Update wavenumber axis when wavelength axis changes"""
+        # Keep the twin axis aligned on every event; the existing ticks stay
+        # correct while panning since each label matches its own position
+        self.ax2.set_xlim(self.ax.get_xlim())
+        
+        # Re-spread the ticks once the pan/zoom burst has settled
+        if self._xlim_after_id is not None:
+            self.window.after_cancel(self._xlim_after_id)
+        self._xlim_after_id = self.window.after(30, self._do_xlim_update)
+    
+    def _do_xlim_update(self):
+        """Place the wavenumber ticks evenly across the current view"""
+        self._xlim_after_id = None
+        if not self.window.winfo_exists():
+            return
+        
         new_xlim = self.ax.get_xlim()
-        self.ax2.set_xlim(new_xlim)
         
         # Create updated wavelength ticks within current view
-        visible_wavelength = np.linspace(new_xlim[0], new_xlim[1], num=5)
+        visible_wavelength = new_xlim[0] + (new_xlim[1] - new_xlim[0]) * TICK_FRACTIONS
         visible_wavenumber = 10000 / visible_wavelength
         
-        # Update the wavenumber axis ticks
+        # Update the wavenumber axis ticks; the pan/zoom has already been
+        # drawn by now, so the new labels need their own redraw
         self.ax2.set_xticks(visible_wavelength)
-        self.ax2.set_xticklabels([f"{wn:.0f}" for wn in visible_wavenumber])
-        
-        # Redraw canvas
+        self.ax2.set_xticklabels(np.char.mod('%.0f', visible_wavenumber).tolist())
         self.canvas.draw_idle()
     
     def save_plot(self):
@@ -246,18 +292,14 @@ class SpectrumViewer:
         
         if file_path:
             try:
-                # Add wavelength column
-                export_df = self.spectrum_df.copy()
-                export_df['Wavelength'] = 10000 / export_df['Wavenumber']
-                
-                # Reorder columns
-                export_df = export_df[['Wavenumber', 'Wavelength', 'Emissivity', 'Uncertainty']]
-                
-                # Save to file
-                if file_path.endswith('.csv'):
-                    export_df.to_csv(file_path, index=False)
-                else:
-                    export_df.to_csv(file_path, sep='\t', index=False)
+                # Stack the cached columns, with wavelength second, and write
+                # them straight out; no DataFrame copy is needed. 17 significant
+                # digits read back as the same doubles, as to_csv's output did
+                columns = ('Wavenumber', 'Wavelength', 'Emissivity', 'Uncertainty')
+                delimiter = ',' if file_path.endswith('.csv') else '\t'
+                np.savetxt(file_path, np.column_stack((self._wn, self._wl, self._emis, self._unc)),
+                           fmt='%.17g', delimiter=delimiter, header=delimiter.join(columns), 
+                           comments='')
                 
                 messagebox.showinfo("Success", f"Data exported to:\n{file_path}")
             except Exception as e: